@@ -32,6 +32,7 @@ class IndexStats:
     chunks_deleted: int = 0
     embeddings_computed: int = 0
     embeddings_cached: int = 0
+    total_chunks: int = 0  # Chunks in the index after this run
 
 
 class Indexer:
@@ -107,6 +108,7 @@ class Indexer:
         if not diff.has_changes:
             if self.verbose:
                 self.console.print("[green]Index is up to date.[/green]")
+            stats.total_chunks = self.storage.count_chunks()
             self._update_manifest(new_tree, stats)
             return stats
 
@@ -146,7 +148,14 @@ class Indexer:
                 if progress_callback:
                     progress_callback(total_files, total_files, "complete")
 
+        # Once all files are written (rather than after every upsert): merge
+        # the small fragments this and earlier runs left behind, then build
+        # the vector index if the table is now big enough
+        self.storage.compact_if_fragmented()
+        self.storage.ensure_vector_index()
+
         # Update manifest with new tree
+        stats.total_chunks = self.storage.count_chunks()
         self._update_manifest(new_tree, stats)
 
         return stats
@@ -325,7 +334,7 @@ class Indexer:
         manifest.tree = tree.to_dict()
         manifest.stats = ManifestStats(
             total_files=stats.files_scanned,
-            total_chunks=self.storage.count_chunks(),
+            total_chunks=stats.total_chunks,
         )
         save_manifest(manifest, self.project_root)
 
@@ -181,7 +181,13 @@ class SearchEngine:
 
         # Vector search
         table = self._get_chunks_table()
-        rows = table.search(query_vector).limit(limit).to_list()
+        rows = (
+            table.search(query_vector)
+            .distance_type(Storage.VECTOR_METRIC)
+            .refine_factor(Storage.VECTOR_REFINE_FACTOR)
+            .limit(limit)
+            .to_list()
+        )
 
         results = []
         for row in rows:
@@ -1,6 +1,9 @@
 """LanceDB storage wrapper for Lance Code RAG."""
 
+import logging
+import math
 from dataclasses import dataclass
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
@@ -9,6 +12,8 @@ import pyarrow as pa
 
 from . import LANCEDB_DIR, LCR_DIR
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class CodeChunk:
@@ -27,23 +32,6 @@ class CodeChunk:
     end_line: int  # 1-indexed end line
     file_hash: str  # Hash of source file (for staleness check)
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for LanceDB insertion."""
-        return {
-            "id": self.id,
-            "vector": self.vector,
-            "text": self.text,
-            "content_hash": self.content_hash,
-            "filepath": self.filepath,
-            "filename": self.filename,
-            "extension": self.extension,
-            "type": self.type,
-            "name": self.name,
-            "start_line": self.start_line,
-            "end_line": self.end_line,
-            "file_hash": self.file_hash,
-        }
-
 
 @dataclass
 class CachedEmbedding:
@@ -53,13 +41,17 @@ class CachedEmbedding:
     vector: list[float]  # The embedding
     created_at: str  # ISO timestamp
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for LanceDB insertion."""
-        return {
-            "content_hash": self.content_hash,
-            "vector": self.vector,
-            "created_at": self.created_at,
-        }
+
+def _to_record_batch(rows: list[Any], schema: pa.Schema) -> pa.RecordBatch:
+    """Build a record batch column-by-column from dataclass rows.
+
+    Extracts each schema field with a single attrgetter pass, avoiding an
+    intermediate dict per row.
+    """
+    return pa.RecordBatch.from_arrays(
+        [pa.array(list(map(attrgetter(field.name), rows)), type=field.type) for field in schema],
+        schema=schema,
+    )
 
 
 class Storage:
@@ -68,11 +60,25 @@ class Storage:
     CHUNKS_TABLE = "code_chunks"
     CACHE_TABLE = "embedding_cache"
 
+    # Vector index settings. Below the threshold a brute-force scan is fast
+    # enough and IVF_PQ training would have too few rows per partition.
+    # l2 is LanceDB's default, so flat and indexed searches score the same.
+    VECTOR_METRIC = "l2"
+    VECTOR_INDEX_MIN_ROWS = 10_000
+    # Indexed searches fetch limit * this many PQ candidates and re-rank them
+    # by exact distance, so ranking and scores don't carry PQ error.
+    VECTOR_REFINE_FACTOR = 10
+
+    # Every upsert adds a new (small) fragment; merge them once a table has
+    # this many so read latency doesn't degrade with incremental updates.
+    COMPACT_MIN_FRAGMENTS = 50
+
     def __init__(self, project_root: Path, dimensions: int = 768):
         self.project_root = project_root
         self.dimensions = dimensions
         self.db_path = project_root / LCR_DIR / LANCEDB_DIR
         self._db: lancedb.DBConnection | None = None
+        self._vector_index_ready = False
 
     def connect(self) -> None:
         """Initialize database connection and create tables if needed."""
@@ -96,7 +102,11 @@ class Storage:
             return self.db.open_table(self.CHUNKS_TABLE)
 
         # Create empty table with schema
-        schema = pa.schema([
+        return self.db.create_table(self.CHUNKS_TABLE, schema=self._chunks_schema())
+
+    def _chunks_schema(self) -> pa.Schema:
+        """Arrow schema for the code_chunks table."""
+        return pa.schema([
             pa.field("id", pa.string()),
             pa.field("vector", pa.list_(pa.float32(), self.dimensions)),
             pa.field("text", pa.string()),
@@ -110,7 +120,6 @@ class Storage:
             pa.field("end_line", pa.int32()),
             pa.field("file_hash", pa.string()),
         ])
-        return self.db.create_table(self.CHUNKS_TABLE, schema=schema)
 
     def _get_cache_table(self) -> lancedb.table.Table:
         """Get or create the embedding_cache table."""
@@ -118,12 +127,15 @@ class Storage:
             return self.db.open_table(self.CACHE_TABLE)
 
         # Create empty table with schema
-        schema = pa.schema([
+        return self.db.create_table(self.CACHE_TABLE, schema=self._cache_schema())
+
+    def _cache_schema(self) -> pa.Schema:
+        """Arrow schema for the embedding_cache table."""
+        return pa.schema([
             pa.field("content_hash", pa.string()),
             pa.field("vector", pa.list_(pa.float32(), self.dimensions)),
             pa.field("created_at", pa.string()),
         ])
-        return self.db.create_table(self.CACHE_TABLE, schema=schema)
 
     # Code chunks operations
 
@@ -133,15 +145,78 @@ class Storage:
             return
 
         table = self._get_chunks_table()
-        data = [chunk.to_dict() for chunk in chunks]
+        data = _to_record_batch(chunks, self._chunks_schema())
 
         # Delete existing chunks with same IDs first
-        chunk_ids = [chunk.id for chunk in chunks]
+        chunk_ids = data.column("id").to_pylist()
         self._delete_by_ids(table, chunk_ids)
 
         # Insert new chunks
         table.add(data)
 
+    def ensure_vector_index(self, min_rows: int = VECTOR_INDEX_MIN_ROWS) -> bool:
+        """Create an IVF_PQ index on the vector column once the table is large enough.
+
+        Called once at the end of an indexing run, not per write. Returns True
+        if the index exists (or was just created).
+        """
+        if self._vector_index_ready:
+            return True
+
+        table = self._get_chunks_table()
+        try:
+            if any("vector" in index.columns for index in table.list_indices()):
+                self._vector_index_ready = True
+                return True
+
+            num_rows = table.count_rows()
+            if num_rows <= min_rows:
+                return False
+
+            table.create_index(
+                metric=self.VECTOR_METRIC,
+                vector_column_name="vector",
+                num_partitions=max(1, int(math.sqrt(num_rows))),
+                num_sub_vectors=self._num_sub_vectors(),
+            )
+            self._vector_index_ready = True
+        except Exception:
+            # Index creation is an optimization - searches fall back to a flat scan
+            logger.warning("Failed to build vector index on %s", self.CHUNKS_TABLE, exc_info=True)
+
+        return self._vector_index_ready
+
+    def compact_if_fragmented(self, min_fragments: int = COMPACT_MIN_FRAGMENTS) -> bool:
+        """Compact each table once it has accumulated min_fragments small fragments.
+
+        Called once at the end of an indexing run. The fragment count is read
+        from the table itself, so it accumulates across runs (each of which
+        uses a fresh Storage). Returns True if any table was compacted.
+        """
+        compacted = False
+        existing = self.db.list_tables().tables
+        for name in (self.CHUNKS_TABLE, self.CACHE_TABLE):
+            if name not in existing:
+                continue
+            table = self.db.open_table(name)
+            try:
+                if table.stats()["fragment_stats"]["num_small_fragments"] < min_fragments:
+                    continue
+                # Compacts fragments and folds new rows into existing indices
+                table.optimize()
+                compacted = True
+            except Exception:
+                # Compaction is an optimization - never fail a run over it
+                logger.warning("Failed to compact %s", name, exc_info=True)
+        return compacted
+
+    def _num_sub_vectors(self) -> int:
+        """Pick a PQ sub-vector count that evenly divides the vector dimensions."""
+        for sub_vector_dims in (16, 8, 4, 2):
+            if self.dimensions % sub_vector_dims == 0:
+                return self.dimensions // sub_vector_dims
+        return 1
+
     def _delete_by_ids(self, table: lancedb.table.Table, ids: list[str]) -> None:
         """Delete rows by ID from a table."""
         if not ids:
@@ -235,10 +310,10 @@ class Storage:
             return
 
         table = self._get_cache_table()
-        data = [emb.to_dict() for emb in embeddings]
+        data = _to_record_batch(embeddings, self._cache_schema())
 
         # Delete existing entries with same hashes first
-        hashes = [emb.content_hash for emb in embeddings]
+        hashes = data.column("content_hash").to_pylist()
         hash_list = ", ".join(f"'{h}'" for h in hashes)
         try:
             table.delete(f"content_hash IN ({hash_list})")
@@ -261,6 +336,7 @@ class Storage:
         try:
             if self.CHUNKS_TABLE in self.db.list_tables().tables:
                 self.db.drop_table(self.CHUNKS_TABLE)
+            self._vector_index_ready = False
             # Note: We keep the cache - it's content-addressed and still valid
         except Exception:
             pass
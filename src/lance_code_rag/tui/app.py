@@ -1,20 +1,30 @@
 """Main TUI application for Lance Code RAG - Mistral Vibe style."""
 
 import asyncio
-import json
+import multiprocessing
+import os
+import queue
+import re
 import shutil
-import time
+import sys
+import threading
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from enum import StrEnum
+from functools import cache, lru_cache
+from multiprocessing import resource_tracker
+from multiprocessing.process import BaseProcess
 from pathlib import Path
-from typing import Literal, cast
+from typing import Any, ClassVar, Literal, cast
 
+import pydantic_core
+from rich.console import Console
+from rich.panel import Panel
 from rich.table import Table
 from textual import on, work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical, VerticalScroll
-from textual.css.query import NoMatches
 from textual.widget import Widget
 from textual.widgets import Static
 from textual.reactive import reactive
@@ -22,9 +32,16 @@ from textual.timer import Timer
 from textual.worker import Worker, WorkerState, get_current_worker
 
 from .. import LCR_DIR
-from ..config import LCRConfig, get_lcr_dir, load_config, save_config
+from ..config import LCRConfig, get_config_path, get_lcr_dir, load_config, save_config
 from ..indexer import IndexStats, run_index
-from ..manifest import Manifest, create_empty_manifest, load_manifest, save_manifest
+from ..manifest import (
+    Manifest,
+    ManifestStats,
+    create_empty_manifest,
+    get_manifest_path,
+    load_manifest,
+    save_manifest,
+)
 from ..search import SearchEngine, SearchError
 from .widgets import InlineSelector, SearchInput, StatusBar, WelcomeBox
 from .widgets.messages import (
@@ -78,6 +95,150 @@ LOCAL_MODELS = [
     ("bge-base", "bge-base (~130MB) - recommended", "BAAI/bge-base-en-v1.5", 768),
     ("bge-large", "bge-large (~330MB) - highest quality", "BAAI/bge-large-en-v1.5", 1024),
 ]
+LOCAL_MODELS_BY_ID: dict[str, tuple[str, str, str, int]] = {m[0]: m for m in LOCAL_MODELS}
+LOCAL_MODEL_OPTIONS = [(m[0], m[1]) for m in LOCAL_MODELS]
+
+# The block _update_gitignore appends, plus the blank line it leaves before it
+_GITIGNORE_BLOCK_RE = re.compile(
+    rf"^(?:\r?\n)?# Lance Code RAG\r?\n{re.escape(LCR_DIR)}/(?:\r?\n|$)", re.MULTILINE
+)
+
+
+# /search flags, matched only as whole whitespace-delimited tokens
+_FUZZY_FLAG_RE = re.compile(r"(?:^|\s)--fuzzy(?=\s|$)")
+_BM25_FLAG_RE = re.compile(r"(^|\s)--bm25-weight(?:=|\s+)(\S+)")
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Get a file's modification time in nanoseconds, or None if missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _has_flag(args: str, flag: str) -> bool:
+    """Check whether a command's args contain flag as a whole token."""
+    return flag in args.split()
+
+
+def _parse_search_args(args: str) -> tuple[str, bool, float]:
+    """Split /search args into (query, fuzzy, bm25_weight).
+
+    Recognizes --fuzzy, --bm25-weight N and --bm25-weight=N as whole tokens.
+    Only the flags are removed - the rest of the query (quotes, backslashes,
+    newlines in pasted code) reaches the search engine verbatim.
+    """
+    query, fuzzy_count = _FUZZY_FLAG_RE.subn("", args)
+
+    bm25_weight = 0.5
+
+    def take_weight(match: re.Match[str]) -> str:
+        nonlocal bm25_weight
+        try:
+            bm25_weight = float(match[2])
+        except ValueError:
+            return match[1] + match[2]  # Not a weight - keep it as a search term
+        return ""
+
+    query = _BM25_FLAG_RE.sub(take_weight, query)
+    return query.strip(), fuzzy_count > 0, bm25_weight
+
+
+_PROGRESS_MIN_STEP = 0.01  # Smallest progress change worth a status bar update
+
+
+def _index_worker(requests: multiprocessing.Queue, events: multiprocessing.Queue) -> None:
+    """Main loop of the long-lived indexing child process.
+
+    Runs one indexing job per (project_root, force) request. Staying alive
+    between runs means lancedb, tree-sitter and the embedding stack are only
+    imported once per session rather than once per /index.
+    """
+    # The child shares the parent's terminal; silence anything (download bars,
+    # native library logs) that would otherwise draw over the TUI
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.dup2(devnull, 2)
+
+    # Poll rather than block so the child exits even if the TUI dies without
+    # a clean interpreter shutdown (SIGKILL, hard crash), where daemon=True
+    # cleanup never runs
+    parent = multiprocessing.parent_process()
+    while parent is None or parent.is_alive():
+        try:
+            project_root, force = requests.get(timeout=1.0)
+        except queue.Empty:
+            continue
+        _index_in_subprocess(project_root, force, events)
+
+
+def _index_in_subprocess(project_root: Path, force: bool, events: multiprocessing.Queue) -> None:
+    """Run one indexing job in the child process, reporting back through a queue.
+
+    Posts ("progress", current, total, stage) tuples while running, then
+    exactly one ("done", IndexStats) or ("error", message).
+    """
+    # Coalesce per-file callbacks: only forward when the bar moves by at least
+    # _PROGRESS_MIN_STEP or the stage changes, so large repos don't flood the UI
+    last_sent: tuple[float, str] | None = None
+
+    def progress_callback(current: int, total: int, stage: str) -> None:
+        nonlocal last_sent
+        ratio = current / total if total > 0 else 0.0
+        if (
+            last_sent is None
+            or stage != last_sent[1]
+            or ratio - last_sent[0] >= _PROGRESS_MIN_STEP
+        ):
+            last_sent = (ratio, stage)
+            events.put(("progress", current, total, stage))
+
+    try:
+        # Null console so Rich never writes to the parent's terminal
+        null_console = Console(force_terminal=False, no_color=True, quiet=True)
+        stats = run_index(
+            project_root,
+            force=force,
+            verbose=False,
+            console=null_console,
+            progress_callback=progress_callback,
+        )
+        events.put(("done", stats))
+    except Exception as e:
+        events.put(("error", str(e)))
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file with pydantic-core's native parser."""
+    return pydantic_core.from_json(path.read_bytes())
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write data as 2-space-indented JSON with a trailing newline."""
+    with path.open("wb") as f:
+        f.write(pydantic_core.to_json(data, indent=2))
+        f.write(b"\n")  # Separate write avoids copying the payload to append
+
+
+@lru_cache(maxsize=4)
+def _load_keybindings(path: Path, mtime_ns: int) -> tuple[dict[str, Any], ...]:
+    """Parse a keybindings.json, cached per mtime so unchanged files aren't re-read."""
+    content = path.read_text()
+    # Handle empty file or just comments
+    if not content.strip() or content.strip().startswith("//"):
+        return ()
+    return tuple(pydantic_core.from_json(content))
+
+
+@cache
+def _vscode_keybindings_path() -> Path:
+    """Get the platform's VS Code user keybindings.json path (resolved once)."""
+    if sys.platform == "darwin":
+        return Path.home() / "Library/Application Support/Code/User/keybindings.json"
+    if sys.platform == "win32":
+        return Path(os.environ.get("APPDATA", "")) / "Code/User/keybindings.json"
+    return Path.home() / ".config/Code/User/keybindings.json"  # Linux
 
 
 class LCRApp(App):
@@ -92,6 +253,20 @@ class LCRApp(App):
         Binding("f1", "help", "Help"),
     ]
 
+    # Slash command -> async handler method name (resolved with getattr per dispatch)
+    _COMMAND_HANDLERS: ClassVar[dict[str, str]] = {
+        "/init": "_handle_init",
+        "/remove": "_handle_remove",
+        "/index": "_handle_index",
+        "/search": "_handle_search",
+        "/status": "_handle_status",
+        "/clean": "_handle_clean",
+        "/terminal-setup": "_handle_terminal_setup",
+        "/help": "_handle_help",
+        "/clear": "_handle_clear",
+        "/quit": "_handle_quit",
+    }
+
     # Reactive state
     is_initialized: reactive[bool] = reactive(False)
     is_indexing: reactive[bool] = reactive(False)
@@ -99,12 +274,31 @@ class LCRApp(App):
     def __init__(self, project_root: Path | None = None) -> None:
         super().__init__()
         self.project_root = project_root or Path.cwd()
+        # Project paths are fixed for the app's lifetime - resolve them once
+        self._lcr_dir = get_lcr_dir(self.project_root)
+        self._config_path = get_config_path(self.project_root)
+        self._manifest_path = get_manifest_path(self.project_root)
         self._search_engine: SearchEngine | None = None
         self._config: LCRConfig | None = None
         self._manifest: Manifest | None = None
-        # Track Ctrl+C timing for two-stage quit
-        self._ctrl_c_time: float = 0.0
-        self._ctrl_c_timer: Timer | None = None  # Timer to reset status message
+        # mtimes of the files backing _config/_manifest (skip re-parsing if unchanged)
+        self._config_mtime: int | None = None
+        self._manifest_mtime: int | None = None
+        # Last /status panel, keyed by the rows it shows
+        self._status_panel: tuple[tuple[tuple[str, str], ...], Panel] | None = None
+        # Armed after a Ctrl+C; a second press while it is pending quits
+        self._ctrl_c_timer: Timer | None = None
+        # Set while a chat scroll-to-end is queued for the next refresh
+        self._scroll_pending = False
+
+        # Indexing child process and its queues, started on the first /index
+        # and reused by later runs (see _index_process_queues)
+        self._index_process: BaseProcess | None = None
+        self._index_requests: multiprocessing.Queue | None = None
+        self._index_events: multiprocessing.Queue | None = None
+        # Held for a whole run: a cancelled run must stop the child before
+        # its exclusive replacement hands it a new job
+        self._index_lock = threading.Lock()
 
         # Multi-step flow state (for /init, /remove)
         self._flow_state = FlowState()
@@ -115,25 +309,17 @@ class LCRApp(App):
 
     def watch_is_initialized(self, is_initialized: bool) -> None:
         """React to initialization state changes."""
-        try:
-            status_bar = self.query_one("#status", StatusBar)
-            if is_initialized:
-                status_bar.set_ready()
-            else:
-                status_bar.set_not_initialized()
-        except NoMatches:
-            pass  # Not yet mounted
+        if is_initialized:
+            self._status_bar.set_ready()
+        else:
+            self._status_bar.set_not_initialized()
 
     def watch_is_indexing(self, is_indexing: bool) -> None:
         """React to indexing state changes."""
-        try:
-            status_bar = self.query_one("#status", StatusBar)
-            if is_indexing:
-                status_bar.set_indexing()
-            else:
-                status_bar.set_ready()
-        except NoMatches:
-            pass  # Not yet mounted
+        if is_indexing:
+            self._status_bar.set_indexing()
+        else:
+            self._status_bar.set_ready()
 
     @property
     def search_engine(self) -> SearchEngine:
@@ -161,9 +347,19 @@ class LCRApp(App):
 
     def _mount_message(self, widget: Widget) -> None:
         """Mount a widget into the chat area and scroll to end."""
-        chat = self.query_one("#chat", VerticalScroll)
-        chat.mount(widget)
-        chat.scroll_end()
+        self._chat.mount(widget)
+        # Messages often arrive in bursts (query, status, results) - queue one
+        # scroll per refresh instead of restarting the scroll for each
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.call_after_refresh(self._flush_scroll)
+
+    def _flush_scroll(self) -> None:
+        """Scroll the chat to the end once for all messages mounted since the last refresh."""
+        self._scroll_pending = False
+        # Already running after the refresh that laid out the new messages, so
+        # max_scroll_y is current - scroll now rather than waiting another refresh
+        self._chat.scroll_end(immediate=True)
 
     async def _show_welcome_box(
         self,
@@ -172,13 +368,10 @@ class LCRApp(App):
         is_initialized: bool = False,
     ) -> None:
         """Display the welcome box with project info."""
-        chat = self.query_one("#chat", VerticalScroll)
         # Remove existing welcome box if present
-        try:
-            existing = chat.query_one("#welcome", WelcomeBox)
-            await existing.remove()
-        except NoMatches:
-            pass
+        if self._welcome is not None:
+            await self._welcome.remove()
+            self._welcome = None
 
         provider = config.embedding_provider if config else None
         model = config.embedding_model if config else None
@@ -192,7 +385,8 @@ class LCRApp(App):
             is_initialized=is_initialized,
             id="welcome",
         )
-        await chat.mount(welcome)
+        await self._chat.mount(welcome)
+        self._welcome = welcome
 
     def _update_welcome_box(
         self,
@@ -201,17 +395,14 @@ class LCRApp(App):
         is_initialized: bool | None = None,
     ) -> None:
         """Update the welcome box info without recreating it."""
-        try:
-            chat = self.query_one("#chat", VerticalScroll)
-            welcome = chat.query_one("#welcome", WelcomeBox)
-            welcome.update_info(
-                provider=config.embedding_provider if config else None,
-                model=config.embedding_model if config else None,
-                file_count=stats.total_files if stats else None,
-                is_initialized=is_initialized,
-            )
-        except NoMatches:
-            pass
+        if self._welcome is None:
+            return  # Cleared from the chat
+        self._welcome.update_info(
+            provider=config.embedding_provider if config else None,
+            model=config.embedding_model if config else None,
+            file_count=stats.total_files if stats else None,
+            is_initialized=is_initialized,
+        )
 
     def _show_user_query(self, query: str) -> None:
         """Display a user query."""
@@ -246,18 +437,27 @@ class LCRApp(App):
         if not success and message:
             self._mount_message(StatusMessage(message, success=False))
 
-    def _clear_chat(self) -> None:
+    async def _clear_chat(self) -> None:
         """Clear all chat content."""
-        chat = self.query_one("#chat", VerticalScroll)
-        chat.remove_children()
+        await self._chat.remove_children()
+        self._welcome = None
 
     async def on_mount(self) -> None:
         """Handle app mount - check initialization and show welcome."""
+        # Cache long-lived widgets so handlers don't re-query the DOM.
+        # _input and _selector are swapped in and out of #input-area; the one
+        # not currently mounted is None.
+        self._chat = self.query_one("#chat", VerticalScroll)
+        self._status_bar = self.query_one("#status", StatusBar)
+        self._input_area = self.query_one("#input-area", Vertical)
+        self._input: SearchInput | None = self.query_one("#input", SearchInput)
+        self._selector: InlineSelector | None = None
+        self._welcome: WelcomeBox | None = None
+
         self._check_initialized()
 
         # Focus the search input
-        search_input = self.query_one("#input", SearchInput)
-        self.call_after_refresh(search_input.focus)
+        self.call_after_refresh(self._input.focus)
 
         # Update status bar
         self._update_status_bar()
@@ -271,17 +471,30 @@ class LCRApp(App):
 
     def _check_initialized(self) -> None:
         """Check if lcr is initialized in this project."""
-        lcr_dir = get_lcr_dir(self.project_root)
-        self.is_initialized = lcr_dir.exists() and (lcr_dir / "config.json").exists()
+        # A single stat: config.json existing implies the lcr dir exists
+        self.is_initialized = _mtime_ns(self._config_path) is not None
 
     def _load_status(self) -> None:
-        """Load config and manifest."""
+        """Load config and manifest, skipping files unchanged since the last load."""
+        config_mtime = _mtime_ns(self._config_path)
+        manifest_mtime = _mtime_ns(self._manifest_path)
         try:
-            self._config = load_config(self.project_root)
-            self._manifest = load_manifest(self.project_root)
+            if self._config is None or config_mtime != self._config_mtime:
+                self._config = load_config(self.project_root)
+                self._config_mtime = config_mtime
+            if self._manifest is None or manifest_mtime != self._manifest_mtime:
+                self._manifest = load_manifest(self.project_root)
+                self._manifest_mtime = manifest_mtime
         except Exception:
             pass
 
+    def _invalidate_status_cache(self) -> None:
+        """Drop the cached config and manifest (e.g., after the index is removed)."""
+        self._config = None
+        self._manifest = None
+        self._config_mtime = None
+        self._manifest_mtime = None
+
     def _update_status_bar(self) -> None:
         """Update status bar file count from manifest.
 
@@ -289,15 +502,11 @@ class LCRApp(App):
         automatically by reactive watchers watch_is_initialized() and
         watch_is_indexing().
         """
-        try:
-            status_bar = self.query_one("#status", StatusBar)
-            file_count = self._manifest.stats.total_files if self._manifest else None
-            status_bar.update(
-                is_initialized=self.is_initialized,
-                file_count=file_count,
-            )
-        except NoMatches:
-            pass  # Not yet mounted
+        file_count = self._manifest.stats.total_files if self._manifest else None
+        self._status_bar.update(
+            is_initialized=self.is_initialized,
+            file_count=file_count,
+        )
 
     async def _show_welcome(self) -> None:
         """Show welcome box with current status."""
@@ -322,19 +531,33 @@ class LCRApp(App):
         The selector replaces the search input at the bottom of the screen.
         When the user makes a selection or cancels, InlineSelector posts
         a message which we handle to restore the input and continue the flow.
+
+        The remove and mount are batched so the swap costs a single repaint.
+        Back-to-back prompts (e.g. /init provider -> model) reuse the mounted
+        selector instead of swapping.
         """
-        input_area = self.query_one("#input-area", Vertical)
-        await input_area.remove_children()
+        if self._selector is not None:
+            await self._selector.reconfigure(title, options, default_index)
+            return
+
         selector = InlineSelector(title, options, default_index, id="selector")
-        await input_area.mount(selector)
+        with self.batch_update():
+            await self._input_area.remove_children()
+            self._input = None
+            await self._input_area.mount(selector)
+        self._selector = selector
         self.call_after_refresh(selector.focus)
 
     async def _switch_to_input(self) -> None:
         """Switch from selector back to search input."""
-        input_area = self.query_one("#input-area", Vertical)
-        await input_area.remove_children()
+        if self._input is not None:
+            return  # Already showing the input - nothing to swap
         search_input = SearchInput(id="input")
-        await input_area.mount(search_input)
+        with self.batch_update():
+            await self._input_area.remove_children()
+            await self._input_area.mount(search_input)
+        self._input = search_input
+        self._selector = None
         self.call_after_refresh(search_input.focus)
 
     # ─────────────────────────────────────────────────────────────────────
@@ -371,15 +594,23 @@ class LCRApp(App):
     def _update_gitignore(self) -> None:
         """Add .lance-code-rag to .gitignore if not present."""
         gitignore_path = self.project_root / ".gitignore"
-        entry = f"\n# Lance Code RAG\n{LCR_DIR}/\n"
+        entry = f"\n# Lance Code RAG\n{LCR_DIR}/\n".encode()
 
-        if gitignore_path.exists():
-            content = gitignore_path.read_text()
-            if LCR_DIR not in content:
-                with open(gitignore_path, "a") as f:
-                    f.write(entry)
-        else:
-            gitignore_path.write_text(entry.lstrip())
+        # Scan read-only first, so a read-only .gitignore that already has
+        # the entry doesn't fail init. Line by line - stops at the entry
+        # without loading the file.
+        needle = LCR_DIR.encode()
+        try:
+            with open(gitignore_path, "rb") as f:
+                if any(needle in line for line in f):
+                    return
+                empty = f.tell() == 0
+        except FileNotFoundError:
+            empty = True
+
+        # "ab" creates a missing file and always writes at the end
+        with open(gitignore_path, "ab") as f:
+            f.write(entry.lstrip() if empty else entry)
 
     @on(SearchInput.CommandSubmitted)
     def handle_command(self, event: SearchInput.CommandSubmitted) -> None:
@@ -390,23 +621,11 @@ class LCRApp(App):
         """
         cmd = event.command
 
-        # All commands are now async handlers (no @work needed with inline pattern)
-        async_handlers = {
-            "/init": self._handle_init,
-            "/remove": self._handle_remove,
-            "/index": self._handle_index,
-            "/search": self._handle_search,
-            "/status": self._handle_status,
-            "/clean": self._handle_clean,
-            "/terminal-setup": self._handle_terminal_setup,
-            "/help": self._handle_help,
-            "/clear": self._handle_clear,
-            "/quit": self._handle_quit,
-        }
-
-        if cmd.command in async_handlers:
+        # All commands are async handlers (no @work needed with inline pattern)
+        handler_name = self._COMMAND_HANDLERS.get(cmd.command)
+        if handler_name:
             self.run_worker(
-                async_handlers[cmd.command](cmd.args),
+                getattr(self, handler_name)(cmd.args),
                 group="commands",
                 exclusive=True,
             )
@@ -422,10 +641,7 @@ class LCRApp(App):
 
         if event.state == WorkerState.ERROR:
             self.log.error(f"Worker failed: {event.worker.error}")
-            try:
-                self._show_status(f"Command failed: {event.worker.error}", success=False)
-            except NoMatches:
-                pass  # Chat not mounted
+            self._show_status(f"Command failed: {event.worker.error}", success=False)
 
     # ─────────────────────────────────────────────────────────────────────
     # /init Flow (multi-step inline selection)
@@ -447,7 +663,7 @@ class LCRApp(App):
             )
             return
 
-        if self.is_initialized and "--force" not in args:
+        if self.is_initialized and not _has_flag(args, "--force"):
             self._show_status("Already initialized", success=False)
             self._show_assistant_message("Use /init --force to reinitialize.", style="dim")
             return
@@ -477,17 +693,16 @@ class LCRApp(App):
 
             # Step 2: select model
             self._flow_state.step = "model"
-            model_options = [(m[0], m[1]) for m in LOCAL_MODELS]
             await self._switch_to_selector(
                 "Select embedding model:",
-                model_options,
+                LOCAL_MODEL_OPTIONS,
                 default_index=1,  # bge-base recommended
             )
 
         elif step == "model":
             # Model selected - finish init
             model_id = value
-            model_info = next((m for m in LOCAL_MODELS if m[0] == model_id), None)
+            model_info = LOCAL_MODELS_BY_ID.get(model_id)
             if not model_info:
                 self._show_status("Invalid model selection", success=False)
                 await self._switch_to_input()
@@ -506,62 +721,71 @@ class LCRApp(App):
                 Literal["local", "gemini", "openai"],
                 self._flow_state.provider or "local",
             )
-            await self._complete_init(
+            self._complete_init(
                 provider=provider,
                 model_name=model_name,
                 dimensions=dimensions,
             )
             self._flow_state.reset()
 
-    async def _complete_init(
+    def _complete_init(
         self, provider: Literal["local", "gemini", "openai"], model_name: str, dimensions: int
     ) -> None:
         """Complete the initialization after selections are made."""
-        try:
-            self._show_assistant_message("Creating config...")
+        self._show_assistant_message("Creating config...")
+        config = LCRConfig(
+            embedding_provider=provider,
+            embedding_model=model_name,
+            embedding_dimensions=dimensions,
+        )
+        self._write_init_files(config)
 
-            # Create config
-            config = LCRConfig(
-                embedding_provider=provider,
-                embedding_model=model_name,
-                embedding_dimensions=dimensions,
-            )
+    @work(exclusive=True, thread=True, group="init")
+    def _write_init_files(self, config: LCRConfig) -> None:
+        """Write the config, manifest, .gitignore and .mcp.json in a thread worker.
 
+        Reports back via call_from_thread(), like _run_indexing.
+        """
+        try:
             # Create directories and save config
-            lcr_dir = get_lcr_dir(self.project_root)
-            lcr_dir.mkdir(parents=True, exist_ok=True)
+            self._lcr_dir.mkdir(parents=True, exist_ok=True)
             save_config(config, self.project_root)
 
             # Create empty manifest
             manifest = create_empty_manifest()
             save_manifest(manifest, self.project_root)
 
-            # Update .gitignore
             self._update_gitignore()
-
-            # Update .mcp.json
             self._update_mcp_config()
+        except Exception as e:
+            self.call_from_thread(
+                self._show_status, f"Initialization failed: {e}", success=False
+            )
+            return
 
-            self.is_initialized = True
-            self._config = config
-            self._manifest = manifest
+        self.call_from_thread(self._on_init_complete, config, manifest)
 
-            self._show_status("Config saved!")
-            self._update_status_bar()
+    def _on_init_complete(self, config: LCRConfig, manifest: Manifest) -> None:
+        """Called from thread once the init files are written."""
+        self._config = config
+        self._manifest = manifest
+        self._config_mtime = _mtime_ns(self._config_path)
+        self._manifest_mtime = _mtime_ns(self._manifest_path)
 
-            # Update welcome box
-            self._update_welcome_box(
-                config=config,
-                stats=manifest.stats,
-                is_initialized=True,
-            )
+        self.is_initialized = True
+        self._show_status("Config saved!")
+        self._update_status_bar()
 
-            # Auto-index - @work decorator handles worker creation
-            self._show_assistant_message("Starting initial indexing...")
-            self._run_indexing(force=False)
+        # Update welcome box
+        self._update_welcome_box(
+            config=config,
+            stats=manifest.stats,
+            is_initialized=True,
+        )
 
-        except Exception as e:
-            self._show_status(f"Initialization failed: {e}", success=False)
+        # Auto-index - @work decorator handles worker creation
+        self._show_assistant_message("Starting initial indexing...")
+        self._run_indexing(force=False)
 
     def _update_mcp_config(self) -> None:
         """Add lance-code-rag to .mcp.json if not present."""
@@ -576,21 +800,22 @@ class LCRApp(App):
 
         try:
             if mcp_path.exists():
-                content = json.loads(mcp_path.read_text())
+                content = _read_json(mcp_path)
             else:
                 content = {"mcpServers": {}}
 
-            if "mcpServers" not in content:
-                content["mcpServers"] = {}
+            servers = content.setdefault("mcpServers", {})
+            if servers.get("lance-code-rag") == config_entry:
+                return  # Already configured - don't touch the file
 
-            content["mcpServers"]["lance-code-rag"] = config_entry
-            mcp_path.write_text(json.dumps(content, indent=2) + "\n")
+            servers["lance-code-rag"] = config_entry
+            _write_json(mcp_path, content)
         except Exception:
             pass  # Non-critical, don't fail init
 
     async def _handle_search(self, query: str) -> None:
         """Handle /search command."""
-        status_bar = self.query_one("#status", StatusBar)
+        status_bar = self._status_bar
 
         if not self.is_initialized:
             self._show_status("Not initialized", success=False)
@@ -605,20 +830,7 @@ class LCRApp(App):
         self._show_user_query(query)
 
         # Parse search options
-        fuzzy = "--fuzzy" in query
-        query = query.replace("--fuzzy", "").strip()
-
-        bm25_weight = 0.5
-        if "--bm25-weight" in query:
-            parts = query.split("--bm25-weight")
-            if len(parts) > 1:
-                try:
-                    weight_str = parts[1].split()[0]
-                    bm25_weight = float(weight_str)
-                    query = parts[0] + " ".join(parts[1].split()[1:])
-                except (IndexError, ValueError):
-                    pass
-            query = query.strip()
+        query, fuzzy, bm25_weight = _parse_search_args(query)
 
         if not query:
             self._show_status("Usage: /search <query>", success=False)
@@ -651,74 +863,104 @@ class LCRApp(App):
             return
 
         # Run indexing in a thread worker (Textual pattern for blocking I/O)
-        force = "--force" in args
+        force = _has_flag(args, "--force")
         self._run_indexing(force=force)
 
     @work(exclusive=True, thread=True, group="indexing")
     def _run_indexing(self, force: bool = False) -> None:
-        """Run the indexing process in a thread worker.
+        """Run the indexing process in a child process, supervised by a thread worker.
 
-        Uses Textual's @work(thread=True) pattern for blocking I/O.
-        UI updates are done via call_from_thread().
+        Indexing is CPU-bound (parsing, embedding), so it runs in a separate
+        process to keep the GIL free for Textual. The thread worker relays the
+        child's progress/result events to the UI via call_from_thread().
         """
-        from rich.console import Console
-
         worker = get_current_worker()
 
         # Update UI to show indexing started (from thread)
         mode = "full re-index" if force else "incremental index"
         self.call_from_thread(self._on_indexing_started, mode)
 
-        # Create progress callback that safely updates UI from thread
-        def progress_callback(current: int, total: int, stage: str) -> None:
-            if not worker.is_cancelled:
-                self.call_from_thread(self._on_indexing_progress, current, total, stage)
+        with self._index_lock:
+            if worker.is_cancelled:
+                return
+            requests, events = self._index_process_queues()
+            requests.put((self.project_root, force))
 
-        try:
-            # Create a null console to prevent Rich from interfering with Textual
-            null_console = Console(force_terminal=False, no_color=True, quiet=True)
-
-            # Run the blocking indexing operation with progress callback
-            stats = run_index(
-                self.project_root,
-                force=force,
-                verbose=False,
-                console=null_console,
-                progress_callback=progress_callback,
-            )
+            while True:
+                if worker.is_cancelled:
+                    # The child is mid-run - it can't be reused
+                    self._stop_index_process()
+                    return
 
-            # Check if cancelled before updating UI
-            if not worker.is_cancelled:
-                self.call_from_thread(self._on_indexing_complete, stats)
+                try:
+                    event = events.get(timeout=0.1)
+                except queue.Empty:
+                    if self._index_process.is_alive():
+                        continue
+                    # Child exited - anything it reported is already in the pipe
+                    try:
+                        event = events.get(timeout=1.0)
+                    except queue.Empty:
+                        exitcode = self._index_process.exitcode
+                        event = ("error", f"indexer exited with code {exitcode}")
+
+                kind, *payload = event
+                if kind == "progress":
+                    self.call_from_thread(self._on_indexing_progress, *payload)
+                elif kind == "done":
+                    self.call_from_thread(self._on_indexing_complete, payload[0])
+                    return
+                else:
+                    self.call_from_thread(self._on_indexing_error, payload[0])
+                    return
 
-        except Exception as e:
-            if not worker.is_cancelled:
-                self.call_from_thread(self._on_indexing_error, str(e))
+    def _index_process_queues(self) -> tuple[multiprocessing.Queue, multiprocessing.Queue]:
+        """Get the indexing child's (requests, events) queues, starting it if needed.
 
-    def _on_indexing_started(self, mode: str) -> None:
-        """Called from thread when indexing starts."""
-        try:
-            status_bar = self.query_one("#status", StatusBar)
-        except NoMatches:
+        Spawning a fresh interpreter costs a second or more of imports, so the
+        child is kept alive between runs. Called with _index_lock held.
+        """
+        if self._index_process is None or not self._index_process.is_alive():
+            self._stop_index_process()  # Reap a child that crashed
+            # spawn, not fork: forking a process that already runs threads is
+            # unsafe. daemon so quitting the TUI doesn't wait on the child.
+            ctx = multiprocessing.get_context("spawn")
+            self._index_requests = ctx.Queue()
+            self._index_events = ctx.Queue()
+            self._index_process = ctx.Process(
+                target=_index_worker,
+                args=(self._index_requests, self._index_events),
+                daemon=True,
+            )
+            self._index_process.start()
+        return self._index_requests, self._index_events
+
+    def _stop_index_process(self) -> None:
+        """Terminate the indexing child (if any) so the next run starts a fresh one."""
+        process = self._index_process
+        if process is None:
             return
+        self._index_process = None
+        self._index_requests = None
+        self._index_events = None
+        if process.is_alive():
+            process.terminate()
+        process.join(timeout=5.0)
 
+    def _on_indexing_started(self, mode: str) -> None:
+        """Called from thread when indexing starts."""
         self.is_indexing = True
-        status_bar.set_indexing(progress=0.0, current=0, total=0)
+        # Set explicitly - the watcher doesn't fire if is_indexing was already True
+        self._status_bar.set_indexing(progress=0.0, current=0, total=0)
         # Simple message in chat - progress updates go to status bar
         self._start_indexing_message(f"Indexing started ({mode})")
 
     def _on_indexing_complete(self, stats: IndexStats) -> None:
         """Called from thread when indexing completes successfully."""
-        try:
-            status_bar = self.query_one("#status", StatusBar)
-        except NoMatches:
-            return
+        self._apply_index_stats(stats)
 
         # Silent completion - just update status bar (no chat message)
         self._finish_indexing_message(success=True)
-
-        # Reload manifest and update displays
-        self._manifest = load_manifest(self.project_root)
         self._update_status_bar()
 
         # Update welcome box with new file count
@@ -729,28 +971,36 @@ class LCRApp(App):
         )
 
         self.is_indexing = False
-        status_bar.set_ready()
+        self._status_bar.set_ready()
 
-    def _on_indexing_error(self, error_msg: str) -> None:
-        """Called from thread when indexing fails."""
-        try:
-            status_bar = self.query_one("#status", StatusBar)
-        except NoMatches:
+    def _apply_index_stats(self, stats: IndexStats) -> None:
+        """Refresh the cached manifest stats from a finished indexing run.
+
+        The run already reports the totals it wrote to the manifest, so there's
+        no need to re-parse the whole manifest (Merkle tree included) from disk.
+        The TUI never reads the cached tree, so it's fine for it to go stale.
+        """
+        if self._manifest is None:
+            self._load_status()
             return
 
+        self._manifest.stats = ManifestStats(
+            total_files=stats.files_scanned,
+            total_chunks=stats.total_chunks,
+        )
+        self._manifest.updated_at = datetime.now(UTC)
+        self._manifest_mtime = _mtime_ns(self._manifest_path)
+
+    def _on_indexing_error(self, error_msg: str) -> None:
+        """Called from thread when indexing fails."""
         self._finish_indexing_message(success=False, message=f"Indexing failed: {error_msg}")
         self.is_indexing = False
-        status_bar.set_ready()
+        self._status_bar.set_ready()
 
     def _on_indexing_progress(self, current: int, total: int, stage: str) -> None:
         """Called from thread to update indexing progress."""
-        try:
-            status_bar = self.query_one("#status", StatusBar)
-        except NoMatches:
-            return
-
         progress = current / total if total > 0 else 0.0
-        status_bar.set_indexing(progress=progress, current=current, total=total)
+        self._status_bar.set_indexing(progress=progress, current=current, total=total)
 
     async def _handle_status(self, args: str) -> None:
         """Handle /status command."""
@@ -759,26 +1009,35 @@ class LCRApp(App):
             self._show_assistant_message("Run /init to set up.", style="dim")
             return
 
-        # Build status table
-        table = Table(show_header=False, box=None, padding=(0, 1))
-        table.add_column("Key", style="cyan")
-        table.add_column("Value")
+        # Pick up changes made outside the TUI (e.g., MCP server re-index)
+        self._load_status()
 
+        rows: list[tuple[str, str]] = []
         if self._config:
-            table.add_row("Provider", self._config.embedding_provider)
-            table.add_row("Model", self._config.embedding_model)
-            table.add_row("Dimensions", str(self._config.embedding_dimensions))
+            rows.append(("Provider", self._config.embedding_provider))
+            rows.append(("Model", self._config.embedding_model))
+            rows.append(("Dimensions", str(self._config.embedding_dimensions)))
 
         if self._manifest:
-            table.add_row("Files", str(self._manifest.stats.total_files))
-            table.add_row("Chunks", str(self._manifest.stats.total_chunks))
-            table.add_row("Updated", self._manifest.updated_at.strftime("%Y-%m-%d %H:%M"))
-
-        table.add_row("Status", "[green]Ready[/green]")
-
-        from rich.panel import Panel
-
-        self._mount_message(Static(Panel(table, title="Index Status", border_style="green")))
+            rows.append(("Files", str(self._manifest.stats.total_files)))
+            rows.append(("Chunks", str(self._manifest.stats.total_chunks)))
+            rows.append(("Updated", self._manifest.updated_at.strftime("%Y-%m-%d %H:%M")))
+
+        rows.append(("Status", "[green]Ready[/green]"))
+
+        # Rebuild the panel only when a value changed. The cached panel is never
+        # mutated, so earlier /status messages can safely share it.
+        rows_key = tuple(rows)
+        if self._status_panel is None or self._status_panel[0] != rows_key:
+            table = Table(show_header=False, box=None, padding=(0, 1))
+            table.add_column("Key", style="cyan")
+            table.add_column("Value")
+            for key, value in rows:
+                table.add_row(key, value)
+            panel = Panel(table, title="Index Status", border_style="green")
+            self._status_panel = (rows_key, panel)
+
+        self._mount_message(Static(self._status_panel[1]))
 
     async def _handle_clean(self, args: str) -> None:
         """Handle /clean command."""
@@ -786,17 +1045,15 @@ class LCRApp(App):
             self._show_status("Nothing to clean - not initialized", success=False)
             return
 
-        if "--confirm" not in args:
+        if not _has_flag(args, "--confirm"):
             self._show_status("This will remove all index data", success=False)
             self._show_assistant_message("Run /clean --confirm to proceed.", style="dim")
             return
 
         try:
-            lcr_dir = get_lcr_dir(self.project_root)
-            shutil.rmtree(lcr_dir)
+            await asyncio.to_thread(shutil.rmtree, self._lcr_dir)
             self.is_initialized = False
-            self._config = None
-            self._manifest = None
+            self._invalidate_status_cache()
             self._search_engine = None
 
             self._show_status("Cleaned successfully!")
@@ -837,29 +1094,45 @@ class LCRApp(App):
             self._show_status("Removal cancelled", success=False)
             return
 
-        # Execute removal with progress
+        self._run_removal()
+
+    @work(exclusive=True, thread=True, group="remove")
+    def _run_removal(self) -> None:
+        """Delete the index and config entries in a thread worker.
+
+        Each step reports its progress via call_from_thread(), so the app keeps
+        repainting while the disk work is in flight.
+        """
         try:
             # 1. Remove .lance-code-rag/ directory
-            self._show_assistant_message("Removing .lance-code-rag/ directory...")
-            lcr_dir = get_lcr_dir(self.project_root)
-            if lcr_dir.exists():
-                shutil.rmtree(lcr_dir)
-            self._show_status("Directory removed!")
+            self.call_from_thread(
+                self._show_assistant_message, "Removing .lance-code-rag/ directory..."
+            )
+            if self._lcr_dir.exists():
+                shutil.rmtree(self._lcr_dir)
+            self.call_from_thread(self._show_status, "Directory removed!")
 
             # 2. Remove from .gitignore
-            self._show_assistant_message("Cleaning .gitignore...")
+            self.call_from_thread(self._show_assistant_message, "Cleaning .gitignore...")
             self._remove_gitignore_entry()
-            self._show_status("Gitignore cleaned!")
+            self.call_from_thread(self._show_status, "Gitignore cleaned!")
 
             # 3. Remove from .mcp.json
-            self._show_assistant_message("Cleaning .mcp.json...")
+            self.call_from_thread(self._show_assistant_message, "Cleaning .mcp.json...")
             self._remove_mcp_config()
-            self._show_status("MCP config cleaned!")
+            self.call_from_thread(self._show_status, "MCP config cleaned!")
+        except Exception as e:
+            self.call_from_thread(self._show_status, f"Removal failed: {e}", success=False)
+            return
+
+        self.call_from_thread(self._on_removal_complete)
 
-            # Reset state
+    async def _on_removal_complete(self) -> None:
+        """Called from thread once the disk work is done."""
+        # Swap in the reset state as one update
+        with self.batch_update():
             self.is_initialized = False
-            self._config = None
-            self._manifest = None
+            self._invalidate_status_cache()
             self._search_engine = None
 
             self._show_status("Removal complete!", success=True)
@@ -868,33 +1141,18 @@ class LCRApp(App):
             # Show not-initialized welcome
             await self._show_welcome_box(is_initialized=False)
 
-        except Exception as e:
-            self._show_status(f"Removal failed: {e}", success=False)
-
     def _remove_gitignore_entry(self) -> None:
         """Remove .lance-code-rag from .gitignore."""
         gitignore_path = self.project_root / ".gitignore"
         if not gitignore_path.exists():
             return
 
-        lines = gitignore_path.read_text().splitlines(keepends=True)
-        new_lines = []
-        skip_next = False
-
-        for line in lines:
-            # Skip the comment and the entry
-            if "# Lance Code RAG" in line:
-                skip_next = True
-                continue
-            if skip_next and LCR_DIR in line:
-                skip_next = False
-                continue
-            skip_next = False
-            new_lines.append(line)
+        content, removed = _GITIGNORE_BLOCK_RE.subn("", gitignore_path.read_text())
+        if not removed:
+            return  # No entry - leave the file untouched
 
         # Write back, removing trailing empty lines
-        content = "".join(new_lines).rstrip() + "\n" if new_lines else ""
-        gitignore_path.write_text(content)
+        gitignore_path.write_text(content.rstrip() + "\n" if content.strip() else "")
 
     def _remove_mcp_config(self) -> None:
         """Remove lance-code-rag from .mcp.json."""
@@ -903,7 +1161,7 @@ class LCRApp(App):
             return
 
         try:
-            content = json.loads(mcp_path.read_text())
+            content = _read_json(mcp_path)
             if "mcpServers" in content and "lance-code-rag" in content["mcpServers"]:
                 del content["mcpServers"]["lance-code-rag"]
 
@@ -911,14 +1169,12 @@ class LCRApp(App):
                 if not content["mcpServers"]:
                     mcp_path.unlink()
                 else:
-                    mcp_path.write_text(json.dumps(content, indent=2) + "\n")
+                    _write_json(mcp_path, content)
         except Exception:
             pass  # Non-critical
 
     async def _handle_terminal_setup(self, args: str) -> None:
         """Handle /terminal-setup command - configure VS Code for Shift+Enter."""
-        import os
-
         # Check if running in VS Code
         is_vscode = os.environ.get("TERM_PROGRAM") == "vscode"
 
@@ -932,16 +1188,7 @@ class LCRApp(App):
             return
 
         # Find VS Code keybindings.json
-        import sys
-
-        if sys.platform == "darwin":
-            keybindings_path = (
-                Path.home() / "Library/Application Support/Code/User/keybindings.json"
-            )
-        elif sys.platform == "win32":
-            keybindings_path = Path(os.environ.get("APPDATA", "")) / "Code/User/keybindings.json"
-        else:  # Linux
-            keybindings_path = Path.home() / ".config/Code/User/keybindings.json"
+        keybindings_path = _vscode_keybindings_path()
 
         # The keybinding we want to add
         new_keybinding = {
@@ -952,14 +1199,10 @@ class LCRApp(App):
         }
 
         try:
-            # Read existing keybindings
-            if keybindings_path.exists():
-                content = keybindings_path.read_text()
-                # Handle empty file or just comments
-                if content.strip() and not content.strip().startswith("//"):
-                    keybindings = json.loads(content)
-                else:
-                    keybindings = []
+            # Read existing keybindings (copied - the parsed tuple is cached)
+            mtime_ns = _mtime_ns(keybindings_path)
+            if mtime_ns is not None:
+                keybindings = list(_load_keybindings(keybindings_path, mtime_ns))
             else:
                 keybindings_path.parent.mkdir(parents=True, exist_ok=True)
                 keybindings = []
@@ -984,7 +1227,7 @@ class LCRApp(App):
             keybindings.append(new_keybinding)
 
             # Write back
-            keybindings_path.write_text(json.dumps(keybindings, indent=2) + "\n")
+            _write_json(keybindings_path, keybindings)
 
             self._show_status("VS Code configured for Shift+Enter!", success=True)
             self._show_assistant_message(
@@ -1002,7 +1245,7 @@ class LCRApp(App):
                 f"Cannot write to {keybindings_path}",
                 style="dim",
             )
-        except json.JSONDecodeError as e:
+        except ValueError as e:  # Malformed JSON
             self._show_status("Invalid keybindings.json", success=False)
             self._show_assistant_message(
                 f"Parse error: {e}. Please fix the file manually.",
@@ -1015,8 +1258,9 @@ class LCRApp(App):
 
     async def _handle_clear(self, args: str) -> None:
         """Handle /clear command."""
-        self._clear_chat()
-        await self._show_welcome()
+        with self.batch_update():
+            await self._clear_chat()
+            await self._show_welcome()
 
     async def _handle_quit(self, args: str) -> None:
         """Handle /quit command."""
@@ -1024,60 +1268,38 @@ class LCRApp(App):
 
     def action_interrupt(self) -> None:
         """Handle Ctrl+C: clear input first, quit on second press within 2 seconds."""
-        current_time = time.monotonic()
-
-        # Cancel any existing timer
+        # The pending timer is the only state: armed means a quit is pending
+        quit_pending = self._ctrl_c_timer is not None
         if self._ctrl_c_timer is not None:
             self._ctrl_c_timer.stop()
             self._ctrl_c_timer = None
 
-        # Try to get input widget - might not exist during flow transitions
-        try:
-            input_widget = self.query_one("#input", SearchInput)
-            has_text = input_widget.text.strip()
-        except NoMatches:
-            has_text = False
-
-        try:
-            status_bar = self.query_one("#status", StatusBar)
-        except NoMatches:
-            # Status bar not available - just quit on Ctrl+C
-            self.exit()
-            return
+        # Input widget is swapped out (None) while a selector is shown
+        input_widget = self._input
+        has_text = input_widget is not None and input_widget.text.strip()
 
         # If there's text in the input, clear it
         if has_text:
             input_widget.clear()
-            self._ctrl_c_time = current_time
-            status_bar.set_status("Input cleared. Press Ctrl+C again to quit.")
-            self._ctrl_c_timer = self.set_timer(2.0, self._reset_ctrl_c_status)
-            return
-
-        # If within 2 seconds of last Ctrl+C, quit
-        if current_time - self._ctrl_c_time < 2.0:
+            self._status_bar.set_status("Input cleared. Press Ctrl+C again to quit.")
+        elif quit_pending:
             self.exit()
             return
+        else:
+            self._status_bar.set_status("Press Ctrl+C again to quit.")
 
-        # First Ctrl+C with empty input: show message and record time
-        self._ctrl_c_time = current_time
-        status_bar.set_status("Press Ctrl+C again to quit.")
         self._ctrl_c_timer = self.set_timer(2.0, self._reset_ctrl_c_status)
 
     def _reset_ctrl_c_status(self) -> None:
         """Reset status bar after Ctrl+C timeout."""
         self._ctrl_c_timer = None
-        self._ctrl_c_time = 0.0  # Reset time so next Ctrl+C starts fresh
         # Restore normal status bar state
-        try:
-            status_bar = self.query_one("#status", StatusBar)
-            if self.is_indexing:
-                status_bar.set_indexing()
-            elif self.is_initialized:
-                status_bar.set_ready()
-            else:
-                status_bar.set_not_initialized()
-        except NoMatches:
-            pass
+        if self.is_indexing:
+            self._status_bar.set_indexing()
+        elif self.is_initialized:
+            self._status_bar.set_ready()
+        else:
+            self._status_bar.set_not_initialized()
 
     def action_quit(self) -> None:
         """Quit the application (used by /quit command)."""
@@ -1085,8 +1307,9 @@ class LCRApp(App):
 
     async def action_clear(self) -> None:
         """Clear the output."""
-        self._clear_chat()
-        await self._show_welcome()
+        with self.batch_update():
+            await self._clear_chat()
+            await self._show_welcome()
 
     def action_help(self) -> None:
         """Show help."""
@@ -1096,4 +1319,10 @@ class LCRApp(App):
 def run_app(project_root: Path | None = None) -> None:
     """Run the TUI application."""
     app = LCRApp(project_root)
+    if os.name == "posix":
+        # Textual swaps sys.stderr for a capture whose fileno() is -1, which
+        # the multiprocessing resource tracker would pass to its helper
+        # process. Start it now, while stderr is real; later spawns from the
+        # indexing worker reuse it. Windows multiprocessing has no tracker.
+        resource_tracker.ensure_running()
     app.run()
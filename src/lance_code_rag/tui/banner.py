@@ -1,6 +1,8 @@
 """Terminal banner with gradient colors for Lance Code RAG."""
 
 import random
+from functools import cache
+from itertools import groupby
 from pathlib import Path
 
 from rich.console import Console
@@ -64,10 +66,16 @@ BORDER_CHAR = "│"
 BORDER_STYLE = "dim #888888"
 
 
+@cache
+def hex_to_rgb(color: str) -> tuple[int, int, int]:
+    """Parse a #rrggbb hex color (cached - gradients reuse a handful of stops)."""
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+
+
 def interpolate_color(color1: str, color2: str, factor: float) -> str:
     """Interpolate between two hex colors."""
-    r1, g1, b1 = int(color1[1:3], 16), int(color1[3:5], 16), int(color1[5:7], 16)
-    r2, g2, b2 = int(color2[1:3], 16), int(color2[3:5], 16), int(color2[5:7], 16)
+    r1, g1, b1 = hex_to_rgb(color1)
+    r2, g2, b2 = hex_to_rgb(color2)
 
     r = int(r1 + (r2 - r1) * factor)
     g = int(g1 + (g2 - g1) * factor)
@@ -91,19 +99,44 @@ def get_gradient_color(position: float, colors: list[str]) -> str:
     return interpolate_color(colors[segment_index], colors[segment_index + 1], segment_position)
 
 
-def create_gradient_text(text: str, colors: list[str] | None = None) -> Text:
-    """Create Rich Text with horizontal gradient."""
-    if colors is None:
-        colors = GRADIENT_COLORS
+@cache
+def gradient_styles(length: int, colors: tuple[str, ...]) -> tuple[str, ...]:
+    """Get the per-column styles for a gradient spanning length columns.
 
-    result = Text()
-    text_len = len(text)
+    Cached, since the banner art, taglines and colors are fixed - the color
+    math then runs once per width instead of once per character per render.
+    """
+    return tuple(
+        f"bold {get_gradient_color(i / max(length - 1, 1), list(colors))}"
+        for i in range(length)
+    )
 
-    for i, char in enumerate(text):
-        position = i / max(text_len - 1, 1)
-        color = get_gradient_color(position, colors)
-        result.append(char, style=f"bold {color}")
 
+def append_gradient(result: Text, text: str, styles: tuple[str, ...]) -> None:
+    """Append text to result and style it with one span per run of columns.
+
+    The text is appended once and runs are styled by range with stylize().
+    Spaces show no foreground color, so runs of them are left unstyled - the
+    banner art is mostly spaces.
+    """
+
+    def run_style(column: tuple[str, str]) -> str | None:
+        char, style = column
+        return None if char == " " else style
+
+    start = len(result)
+    result.append(text)
+    for style, run in groupby(zip(text, styles), key=run_style):
+        end = start + sum(1 for _ in run)
+        if style is not None:
+            result.stylize(style, start, end)
+        start = end
+
+
+def create_gradient_text(text: str, colors: list[str] | None = None) -> Text:
+    """Create Rich Text with horizontal gradient."""
+    result = Text()
+    append_gradient(result, text, gradient_styles(len(text), tuple(colors or GRADIENT_COLORS)))
     return result
 
 
@@ -125,11 +158,11 @@ def create_gradient_banner(
         width: Width to center within (if None, uses max line length)
         tagline: Optional tagline to display below banner art
     """
-    if colors is None:
-        colors = GRADIENT_COLORS
+    colors_key = tuple(colors or GRADIENT_COLORS)
 
     result = Text()
     max_len = max(len(line) for line in lines)
+    line_styles = gradient_styles(max_len, colors_key)
 
     # Use max line length as the centering width if not specified
     if width is None:
@@ -143,10 +176,7 @@ def create_gradient_banner(
             result.append(" " * padding)
 
         # Add gradient text
-        for i, char in enumerate(line):
-            position = i / max(max_len - 1, 1)
-            color = get_gradient_color(position, colors)
-            result.append(char, style=f"bold {color}")
+        append_gradient(result, line, line_styles)
         result.append("\n")
 
     # Add tagline if provided
@@ -156,10 +186,7 @@ def create_gradient_banner(
             padding = (width - len(tagline)) // 2
             result.append(" " * padding)
         # Render tagline with gradient
-        for i, char in enumerate(tagline):
-            position = i / max(len(tagline) - 1, 1)
-            color = get_gradient_color(position, colors)
-            result.append(char, style=f"bold {color}")
+        append_gradient(result, tagline, gradient_styles(len(tagline), colors_key))
         result.append("\n")
 
     # Add info lines below (gray, no gradient)
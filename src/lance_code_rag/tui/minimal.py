@@ -9,7 +9,10 @@ our widget complexity. Uses ONLY:
 If this works, we can expand it. If not, we move to prompt_toolkit.
 """
 
+import inspect
+from functools import cache
 from pathlib import Path
+from typing import ClassVar
 
 from rich.panel import Panel
 from rich.syntax import Syntax
@@ -20,6 +23,37 @@ from textual.containers import VerticalScroll
 from textual.widgets import Input, Static
 
 
+@cache
+def _help_panel() -> Panel:
+    """Build the /help panel (cached - its content never changes)."""
+    help_text = Text()
+    help_text.append("Available Commands\n\n", style="bold underline")
+
+    commands = [
+        ("/search <query>", "Search the codebase"),
+        ("/status", "Show index status"),
+        ("/clear", "Clear the output"),
+        ("/scroll", "Add test content (debug)"),
+        ("/help", "Show this help"),
+        ("/quit", "Exit the application"),
+    ]
+
+    for cmd, desc in commands:
+        help_text.append(f"  {cmd:<20}", style="cyan bold")
+        help_text.append(f" {desc}\n")
+
+    help_text.append("\nKeyboard Shortcuts\n", style="bold underline")
+    help_text.append("  Ctrl+C              ", style="dim")
+    help_text.append("Exit\n")
+    help_text.append("  Ctrl+L              ", style="dim")
+    help_text.append("Clear output\n")
+
+    help_text.append("\nTip: ", style="bold yellow")
+    help_text.append("Type any text without '/' to search directly.\n", style="dim")
+
+    return Panel(help_text, title="Help", border_style="blue")
+
+
 class MinimalApp(App):
     """Minimal TUI with flat widget hierarchy."""
 
@@ -51,9 +85,22 @@ class MinimalApp(App):
         ("ctrl+l", "clear", "Clear"),
     ]
 
+    # Argument-less slash commands -> handler method names (/search takes args)
+    _COMMAND_HANDLERS: ClassVar[dict[str, str]] = {
+        "help": "_show_help",
+        "quit": "exit",
+        "q": "exit",
+        "clear": "action_clear",
+        "status": "_show_status",
+        # Debug: add lots of content to test scrolling
+        "scroll": "_add_scroll_test",
+    }
+
     def __init__(self, project_root: Path | None = None):
         super().__init__()
         self.project_root = project_root or Path.cwd()
+        # Shown on mount and after every clear - the content never changes
+        self._welcome_panel = self._build_welcome()
 
     def compose(self) -> ComposeResult:
         vs = VerticalScroll(id="output")
@@ -62,28 +109,38 @@ class MinimalApp(App):
         yield Input(placeholder="> Enter command or search query", id="input")
 
     def on_mount(self) -> None:
+        # Cache the output container - it lives for the app's lifetime
+        self._output = self.query_one("#output", VerticalScroll)
         self._show_welcome()
         self.query_one("#input", Input).focus()
 
+    def _build_welcome(self) -> Panel:
+        """Build the welcome panel for this project."""
+        welcome = Text.assemble(
+            ("Lance Code RAG\n", "bold cyan"),
+            (f"Project: {self.project_root}\n", "dim"),
+            ("\nType /help for commands, or just type to search.\n", "dim"),
+        )
+        return Panel(welcome, title="Welcome", border_style="cyan")
+
     def _show_welcome(self) -> None:
         """Show welcome message."""
-        welcome = Text()
-        welcome.append("Lance Code RAG\n", style="bold cyan")
-        welcome.append(f"Project: {self.project_root}\n", style="dim")
-        welcome.append("\nType /help for commands, or just type to search.\n", style="dim")
-        self._add_output(Panel(welcome, title="Welcome", border_style="cyan"))
+        self._add_output(self._welcome_panel)
 
     def _add_output(self, content) -> None:
         """Add any Rich renderable as a Static widget."""
-        output = self.query_one("#output", VerticalScroll)
-        output.mount(Static(content))
-        output.scroll_end(animate=False)
+        self._add_outputs([content])
+
+    def _add_outputs(self, contents: list) -> None:
+        """Add several Rich renderables with a single mount and scroll."""
+        self._output.mount(*(Static(content) for content in contents))
+        self._output.scroll_end(animate=False)
 
     def _add_text(self, text: str, style: str = "") -> None:
         """Add simple text output."""
         self._add_output(Text(text, style=style))
 
-    def on_input_submitted(self, event: Input.Submitted) -> None:
+    async def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle input submission."""
         query = event.value.strip()
         if not query:
@@ -100,64 +157,35 @@ class MinimalApp(App):
 
         # Parse and handle
         if query.startswith("/"):
-            self._handle_command(query)
+            await self._handle_command(query)
         else:
             self._handle_search(query)
 
-    def _handle_command(self, command: str) -> None:
+    async def _handle_command(self, command: str) -> None:
         """Handle slash commands."""
         parts = command[1:].split(maxsplit=1)
         cmd = parts[0].lower()
         args = parts[1] if len(parts) > 1 else ""
 
-        if cmd == "help":
-            self._show_help()
-        elif cmd == "quit" or cmd == "q":
-            self.exit()
-        elif cmd == "clear":
-            self.action_clear()
-        elif cmd == "search":
+        if cmd == "search":
             if args:
                 self._handle_search(args)
             else:
                 self._add_text("Usage: /search <query>", style="yellow")
-        elif cmd == "status":
-            self._show_status()
-        elif cmd == "scroll":
-            # Debug: add lots of content to test scrolling
-            self._add_scroll_test()
+            return
+
+        handler_name = self._COMMAND_HANDLERS.get(cmd)
+        if handler_name:
+            result = getattr(self, handler_name)()
+            if inspect.isawaitable(result):  # e.g. action_clear
+                await result
         else:
             self._add_text(f"Unknown command: /{cmd}", style="red")
             self._add_text("Type /help for available commands", style="dim")
 
     def _show_help(self) -> None:
         """Show help information."""
-        help_text = Text()
-        help_text.append("Available Commands\n\n", style="bold underline")
-
-        commands = [
-            ("/search <query>", "Search the codebase"),
-            ("/status", "Show index status"),
-            ("/clear", "Clear the output"),
-            ("/scroll", "Add test content (debug)"),
-            ("/help", "Show this help"),
-            ("/quit", "Exit the application"),
-        ]
-
-        for cmd, desc in commands:
-            help_text.append(f"  {cmd:<20}", style="cyan bold")
-            help_text.append(f" {desc}\n")
-
-        help_text.append("\nKeyboard Shortcuts\n", style="bold underline")
-        help_text.append("  Ctrl+C              ", style="dim")
-        help_text.append("Exit\n")
-        help_text.append("  Ctrl+L              ", style="dim")
-        help_text.append("Clear output\n")
-
-        help_text.append("\nTip: ", style="bold yellow")
-        help_text.append("Type any text without '/' to search directly.\n", style="dim")
-
-        self._add_output(Panel(help_text, title="Help", border_style="blue"))
+        self._add_output(_help_panel())
 
     def _show_status(self) -> None:
         """Show status information."""
@@ -186,17 +214,23 @@ class MinimalApp(App):
 
     def _add_scroll_test(self) -> None:
         """Add test content to verify scrolling works."""
-        self._add_text("Adding 50 lines of test content...", style="yellow")
-
-        for i in range(1, 51):
-            self._add_text(f"  Line {i:02d}: Test content for scroll verification")
-
-        self._add_text("Done! Try scrolling with mouse wheel.", style="green")
-
-    def action_clear(self) -> None:
+        self._add_outputs(
+            [
+                Text("Adding 50 lines of test content...", style="yellow"),
+                *(
+                    Text(f"  Line {i:02d}: Test content for scroll verification")
+                    for i in range(1, 51)
+                ),
+                Text("Done! Try scrolling with mouse wheel.", style="green"),
+            ]
+        )
+
+    async def action_clear(self) -> None:
         """Clear the output area."""
-        self.query_one("#output", VerticalScroll).remove_children()
-        self._show_welcome()
+        # Hold repaints until the old output is gone and the welcome is back
+        with self.batch_update():
+            await self._output.remove_children()
+            self._show_welcome()
 
     def action_quit(self) -> None:
         """Quit the application."""
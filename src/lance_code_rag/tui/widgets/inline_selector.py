@@ -17,6 +17,16 @@ from textual.widgets import Static
 
 LAVENDER = "#b7a8e4"
 
+# Key hints shown under every prompt - built once and shared by all selectors
+_HINTS = Text.assemble(
+    ("↑↓", LAVENDER),
+    (" navigate  ", "dim"),
+    ("Enter", LAVENDER),
+    (" select  ", "dim"),
+    ("ESC", LAVENDER),
+    (" cancel", "dim"),
+)
+
 
 class InlineSelector(Vertical):
     """Inline selection widget that replaces the input area.
@@ -108,6 +118,7 @@ class InlineSelector(Vertical):
         self._options = options
         self._selected_index = default_index
         self._option_widgets: list[Static] = []
+        self._row_texts = self._build_row_texts(options)
 
     def compose(self):
         """Compose the selector UI."""
@@ -120,44 +131,95 @@ class InlineSelector(Vertical):
             yield widget
 
         # Hints
-        hints = Text()
-        hints.append("↑↓", style=LAVENDER)
-        hints.append(" navigate  ", style="dim")
-        hints.append("Enter", style=LAVENDER)
-        hints.append(" select  ", style="dim")
-        hints.append("ESC", style=LAVENDER)
-        hints.append(" cancel", style="dim")
-        yield Static(hints, id="selector-hints")
+        yield Static(_HINTS, id="selector-hints")
 
     def on_mount(self) -> None:
         """Focus self and update display on mount."""
         self._update_display()
         self.focus()
 
+    async def reconfigure(
+        self,
+        title: str,
+        options: list[tuple[str, str]],
+        default_index: int = 0,
+    ) -> None:
+        """Reuse this selector for a new prompt instead of mounting a new one.
+
+        Existing option rows are kept and relabelled; rows are only mounted
+        or removed when the option count changes.
+
+        Args:
+            title: Prompt title text
+            options: List of (value, display_text) tuples
+            default_index: Initially selected option index
+        """
+        self._title = title
+        self._options = options
+        self._selected_index = default_index
+        self._row_texts = self._build_row_texts(options)
+        self.query_one("#selector-title", Static).update(title)
+
+        extra_rows = self._option_widgets[len(options) :]
+        if extra_rows:
+            await self.remove_children(extra_rows)
+        new_rows = [
+            Static("", classes="option")
+            for _ in range(len(options) - len(self._option_widgets))
+        ]
+        if new_rows:
+            await self.mount_all(new_rows, before="#selector-hints")
+        self._option_widgets = self._option_widgets[: len(options)] + new_rows
+
+        self._update_display()
+
     def on_blur(self, event: events.Blur) -> None:
         """Recapture focus to prevent escape during selection."""
         self.call_after_refresh(self.focus)
 
     def _update_display(self) -> None:
         """Update option displays with current selection state."""
-        for i, widget in enumerate(self._option_widgets):
-            value, label = self._options[i]
-            if i == self._selected_index:
-                widget.update(f"[bold cyan]› {label}[/bold cyan]")
-                widget.add_class("selected")
-            else:
-                widget.update(f"[dim]  {label}[/dim]")
-                widget.remove_class("selected")
+        for i in range(len(self._option_widgets)):
+            self._paint_row(i)
+
+    @staticmethod
+    def _build_row_texts(options: list[tuple[str, str]]) -> list[tuple[Text, Text]]:
+        """Build each option's (selected, unselected) row text up front.
+
+        Navigation then swaps prebuilt Text objects instead of formatting and
+        parsing markup on every keypress.
+        """
+        return [
+            (Text(f"› {label}", style="bold cyan"), Text(f"  {label}", style="dim"))
+            for _, label in options
+        ]
+
+    def _paint_row(self, index: int) -> None:
+        """Update a single option row for its selection state."""
+        widget = self._option_widgets[index]
+        selected_text, unselected_text = self._row_texts[index]
+        if index == self._selected_index:
+            widget.update(selected_text)
+            widget.add_class("selected")
+        else:
+            widget.update(unselected_text)
+            widget.remove_class("selected")
+
+    def _move_to(self, index: int) -> None:
+        """Select index, repainting only the rows whose state changed."""
+        previous = self._selected_index
+        self._selected_index = index
+        if index != previous:
+            self._paint_row(previous)
+            self._paint_row(index)
 
     def action_move_up(self) -> None:
         """Move selection up (with wrap-around)."""
-        self._selected_index = (self._selected_index - 1) % len(self._options)
-        self._update_display()
+        self._move_to((self._selected_index - 1) % len(self._options))
 
     def action_move_down(self) -> None:
         """Move selection down (with wrap-around)."""
-        self._selected_index = (self._selected_index + 1) % len(self._options)
-        self._update_display()
+        self._move_to((self._selected_index + 1) % len(self._options))
 
     def action_select(self) -> None:
         """Select the current option."""
@@ -165,26 +227,25 @@ class InlineSelector(Vertical):
             value, label = self._options[self._selected_index]
             self.post_message(self.OptionSelected(value, label))
 
+    def _quick_select(self, index: int) -> None:
+        """Select the option at index, if present, and submit it."""
+        if index < len(self._options):
+            # Only the two affected rows are repainted - the selector is
+            # usually swapped out or reconfigured right after
+            self._move_to(index)
+            self.action_select()
+
     def action_select_1(self) -> None:
         """Quick select option 1."""
-        if len(self._options) >= 1:
-            self._selected_index = 0
-            self._update_display()
-            self.action_select()
+        self._quick_select(0)
 
     def action_select_2(self) -> None:
         """Quick select option 2."""
-        if len(self._options) >= 2:
-            self._selected_index = 1
-            self._update_display()
-            self.action_select()
+        self._quick_select(1)
 
     def action_select_3(self) -> None:
         """Quick select option 3."""
-        if len(self._options) >= 3:
-            self._selected_index = 2
-            self._update_display()
-            self.action_select()
+        self._quick_select(2)
 
     def action_cancel(self) -> None:
         """Cancel selection."""
@@ -1,13 +1,109 @@
 """Message components for conversational TUI display."""
 
-from rich.console import RenderableType
+import io
+from functools import cache, lru_cache
+
+from pygments.lexer import Lexer
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
+from rich.console import Console, RenderableType
 from rich.panel import Panel
-from rich.syntax import Syntax
+from rich.syntax import Syntax, SyntaxTheme
 from rich.text import Text
+from textual import work
 from textual.widgets import Static
+from textual.worker import get_current_worker
 
 from ...search import SearchResult, SearchResults
 
+# Resolved once - Syntax would otherwise rebuild the theme per preview
+_SYNTAX_THEME: SyntaxTheme = Syntax.get_theme("monokai")
+
+# Result type -> header color
+_TYPE_COLORS: dict[str, str] = {
+    "function": "green",
+    "class": "blue",
+    "method": "cyan",
+    "module": "yellow",
+}
+
+# File extension -> Pygments lexer name
+_LANG_MAP: dict[str, str] = {
+    "py": "python",
+    "js": "javascript",
+    "ts": "typescript",
+    "tsx": "typescript",
+    "jsx": "javascript",
+    "go": "go",
+    "rs": "rust",
+    "java": "java",
+    "c": "c",
+    "cpp": "cpp",
+    "h": "c",
+    "hpp": "cpp",
+    "rb": "ruby",
+    "php": "php",
+    "swift": "swift",
+    "kt": "kotlin",
+    "scala": "scala",
+    "cs": "csharp",
+}
+
+
+@cache
+def _get_lexer(lang: str) -> Lexer | str:
+    """Get a shared Pygments lexer for lang.
+
+    Syntax looks its lexer up by name on every highlight (i.e. every render)
+    when given a string; a lexer instance skips that. Options match the ones
+    Syntax uses. Unknown names are returned as-is so Syntax falls back to
+    plain text.
+    """
+    try:
+        return get_lexer_by_name(lang, stripnl=False, ensurenl=True, tabsize=4)
+    except ClassNotFound:
+        return lang
+
+
+class _CachedSyntax(Syntax):
+    """Syntax that keeps its highlighted Text instead of re-lexing per render.
+
+    Syntax.highlight() runs Pygments on every render (each refresh and resize);
+    the code never changes, so the result is reused.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._highlight_cache: tuple[tuple, Text] | None = None
+
+    def highlight(self, code: str, line_range: tuple | None = None) -> Text:
+        key = (code, line_range)
+        if self._highlight_cache is None or self._highlight_cache[0] != key:
+            self._highlight_cache = (key, super().highlight(code, line_range))
+        # Rendering may trim the Text in place - hand out a copy
+        return self._highlight_cache[1].copy()
+
+    @property
+    def is_highlighted(self) -> bool:
+        """Whether the code has already been lexed."""
+        return self._highlight_cache is not None
+
+
+@lru_cache(maxsize=512)
+def _build_syntax(preview: str, lang: str) -> _CachedSyntax:
+    """Get the Syntax for a code preview, shared by identical snippets.
+
+    The same chunk often shows up again in later searches; sharing the
+    Syntax means it is only lexed once.
+    """
+    return _CachedSyntax(
+        preview,
+        _get_lexer(lang),
+        theme=_SYNTAX_THEME,
+        line_numbers=False,
+        word_wrap=True,
+    )
+
 
 class UserQuery(Static):
     """Displays user input as '> query text'."""
@@ -22,12 +118,11 @@ class UserQuery(Static):
     def __init__(self, query: str, **kwargs) -> None:
         super().__init__(**kwargs)
         self._query = query
+        # Content is fixed once mounted - build the Text once, not per render
+        self._text = Text.assemble(("> ", "bold cyan"), (query, "bold"))
 
     def render(self) -> RenderableType:
-        text = Text()
-        text.append("> ", style="bold cyan")
-        text.append(self._query, style="bold")
-        return text
+        return self._text
 
 
 class AssistantMessage(Static):
@@ -44,12 +139,10 @@ class AssistantMessage(Static):
         super().__init__(**kwargs)
         self._message = message
         self._style = style
+        self._text = Text.assemble(("● ", "cyan"), (message, style))
 
     def render(self) -> RenderableType:
-        text = Text()
-        text.append("● ", style="cyan")
-        text.append(self._message, style=self._style)
-        return text
+        return self._text
 
 
 class StatusMessage(Static):
@@ -69,8 +162,9 @@ class StatusMessage(Static):
         self._message = message
         self._success = success
         self._details = details
+        self._text = self._build_text()
 
-    def render(self) -> RenderableType:
+    def _build_text(self) -> Text:
         text = Text()
         if self._success:
             text.append("✓ ", style="bold green")
@@ -84,6 +178,9 @@ class StatusMessage(Static):
 
         return text
 
+    def render(self) -> RenderableType:
+        return self._text
+
 
 class SearchResultItem(Static):
     """Displays a single search result with code preview."""
@@ -99,18 +196,12 @@ class SearchResultItem(Static):
         super().__init__(**kwargs)
         self._rank = rank
         self._result = result
+        self._text = self._build_text()
 
-    def render(self) -> RenderableType:
+    def _build_text(self) -> Text:
         result = self._result
 
-        # Type colors
-        type_colors = {
-            "function": "green",
-            "class": "blue",
-            "method": "cyan",
-            "module": "yellow",
-        }
-        color = type_colors.get(result.type, "white")
+        color = _TYPE_COLORS.get(result.type, "white")
 
         # Header line: rank, type, name, score
         header = Text()
@@ -127,6 +218,9 @@ class SearchResultItem(Static):
 
         return header
 
+    def render(self) -> RenderableType:
+        return self._text
+
 
 class CodePreview(Static):
     """Displays a syntax-highlighted code preview in a bordered panel."""
@@ -144,7 +238,6 @@ class CodePreview(Static):
         self._filepath = filepath
         self._max_lines = max_lines
 
-    def render(self) -> RenderableType:
         # Truncate to max lines
         lines = self._code.split("\n")[: self._max_lines]
         preview = "\n".join(lines)
@@ -152,44 +245,33 @@ class CodePreview(Static):
             preview += "\n..."
 
         # Detect language from filepath
-        ext = (
-            self._filepath.rsplit(".", 1)[-1] if "." in self._filepath else "text"
-        )
-        lang_map = {
-            "py": "python",
-            "js": "javascript",
-            "ts": "typescript",
-            "tsx": "typescript",
-            "jsx": "javascript",
-            "go": "go",
-            "rs": "rust",
-            "java": "java",
-            "c": "c",
-            "cpp": "cpp",
-            "h": "c",
-            "hpp": "cpp",
-            "rb": "ruby",
-            "php": "php",
-            "swift": "swift",
-            "kt": "kotlin",
-            "scala": "scala",
-            "cs": "csharp",
-        }
-        lang = lang_map.get(ext, "text")
-
-        syntax = Syntax(
-            preview,
-            lang,
-            theme="monokai",
-            line_numbers=False,
-            word_wrap=True,
-        )
-
-        return Panel(
-            syntax,
-            border_style="dim",
-            padding=(0, 1),
-        )
+        dot = self._filepath.rfind(".")
+        ext = self._filepath[dot + 1 :] if dot >= 0 else "text"
+        lang = _LANG_MAP.get(ext, "text")
+
+        self._syntax = _build_syntax(preview, lang)
+        # The code is fixed, so both panels are built once; plain text is shown
+        # until the code has been highlighted off the UI thread (unless another
+        # preview of the same snippet already did it)
+        self._panel = Panel(self._syntax, border_style="dim", padding=(0, 1))
+        self._plain_panel = Panel(Text(preview), border_style="dim", padding=(0, 1))
+        self._highlighted = self._syntax.is_highlighted
+
+    def prehighlight(self, console: Console) -> None:
+        """Run the Pygments pass ahead of time (safe to call from a worker thread).
+
+        Renders once to a throwaway console so the highlighted Text is cached
+        with exactly the arguments a real render uses.
+        """
+        console.render_lines(self._syntax, pad=False)
+
+    def show_highlighted(self) -> None:
+        """Switch from the plain-text placeholder to the highlighted code."""
+        self._highlighted = True
+        self.refresh(layout=True)
+
+    def render(self) -> RenderableType:
+        return self._panel if self._highlighted else self._plain_panel
 
 
 class SearchResultsDisplay(Static):
@@ -234,6 +316,24 @@ class SearchResultsDisplay(Static):
             yield SearchResultItem(i, result)
             yield CodePreview(result.text, result.filepath)
 
+    def on_mount(self) -> None:
+        """Start highlighting the code previews in the background."""
+        previews = [p for p in self.query(CodePreview) if not p._highlighted]
+        if previews:
+            self._highlight_previews(previews)
+
+    @work(thread=True, group="highlight")
+    def _highlight_previews(self, previews: list[CodePreview]) -> None:
+        """Highlight previews in a thread so Pygments never blocks the UI."""
+        worker = get_current_worker()
+        # Null console - Rich output in threads must not touch the terminal
+        console = Console(file=io.StringIO(), force_terminal=False, no_color=True)
+        for preview in previews:
+            if worker.is_cancelled:
+                return
+            preview.prehighlight(console)
+            self.app.call_from_thread(preview.show_highlighted)
+
 
 class IndexingProgress(Static):
     """Shows indexing progress with spinner."""
@@ -266,6 +366,49 @@ class IndexingProgress(Static):
         return text
 
 
+@cache
+def _help_panel() -> Panel:
+    """Build the /help panel (cached - its content never changes)."""
+    text = Text()
+    text.append("Available Commands\n\n", style="bold underline")
+
+    commands = [
+        ("/search <query>", "Search the indexed codebase"),
+        ("/index", "Index the codebase (incremental)"),
+        ("/index --force", "Force full re-index"),
+        ("/status", "Show index status and statistics"),
+        ("/init", "Reinitialize with different settings"),
+        ("/clean", "Remove .lance-code-rag directory"),
+        ("/terminal-setup", "Configure Shift+Enter in VS Code"),
+        ("/clear", "Clear the output"),
+        ("/help", "Show this help message"),
+        ("/quit", "Exit the application"),
+    ]
+
+    for cmd, desc in commands:
+        text.append(f"  {cmd:<22}", style="cyan bold")
+        text.append(f" {desc}\n")
+
+    text.append("\nKeyboard Shortcuts:\n", style="bold underline")
+    text.append("  Enter              ", style="dim")
+    text.append("Submit query\n")
+    text.append("  \\ + Enter          ", style="dim")
+    text.append("New line (works everywhere)\n")
+    text.append("  Shift/Alt+Enter    ", style="dim")
+    text.append("New line (terminal-dependent)\n")
+    text.append("  Up/Down            ", style="dim")
+    text.append("Command history\n")
+    text.append("  Ctrl+L             ", style="dim")
+    text.append("Clear output\n")
+    text.append("  Ctrl+C             ", style="dim")
+    text.append("Exit\n")
+
+    text.append("\nTip: ", style="bold yellow")
+    text.append("Type any text without '/' to search directly.\n", style="dim")
+
+    return Panel(text, title="Help", border_style="blue")
+
+
 class HelpDisplay(Static):
     """Displays help information."""
 
@@ -277,41 +420,4 @@ class HelpDisplay(Static):
     """
 
     def render(self) -> RenderableType:
-        text = Text()
-        text.append("Available Commands\n\n", style="bold underline")
-
-        commands = [
-            ("/search <query>", "Search the indexed codebase"),
-            ("/index", "Index the codebase (incremental)"),
-            ("/index --force", "Force full re-index"),
-            ("/status", "Show index status and statistics"),
-            ("/init", "Reinitialize with different settings"),
-            ("/clean", "Remove .lance-code-rag directory"),
-            ("/terminal-setup", "Configure Shift+Enter in VS Code"),
-            ("/clear", "Clear the output"),
-            ("/help", "Show this help message"),
-            ("/quit", "Exit the application"),
-        ]
-
-        for cmd, desc in commands:
-            text.append(f"  {cmd:<22}", style="cyan bold")
-            text.append(f" {desc}\n")
-
-        text.append("\nKeyboard Shortcuts:\n", style="bold underline")
-        text.append("  Enter              ", style="dim")
-        text.append("Submit query\n")
-        text.append("  \\ + Enter          ", style="dim")
-        text.append("New line (works everywhere)\n")
-        text.append("  Shift/Alt+Enter    ", style="dim")
-        text.append("New line (terminal-dependent)\n")
-        text.append("  Up/Down            ", style="dim")
-        text.append("Command history\n")
-        text.append("  Ctrl+L             ", style="dim")
-        text.append("Clear output\n")
-        text.append("  Ctrl+C             ", style="dim")
-        text.append("Exit\n")
-
-        text.append("\nTip: ", style="bold yellow")
-        text.append("Type any text without '/' to search directly.\n", style="dim")
-
-        return Panel(text, title="Help", border_style="blue")
+        return _help_panel()
@@ -1,6 +1,7 @@
 """Search input widget with multiline support and auto-grow."""
 
 import time
+from collections import deque
 from dataclasses import dataclass
 
 from textual import on
@@ -77,6 +78,9 @@ class SearchInput(TextArea):
     # Note: Backslash+Enter is handled separately in on_key()
     NEWLINE_KEYS = {"shift+enter", "alt+enter", "ctrl+j"}
 
+    # Oldest history entries are dropped beyond this many
+    HISTORY_LIMIT = 500
+
     def __init__(self, **kwargs) -> None:
         # Remove any conflicting kwargs before passing to parent
         kwargs.pop("placeholder", None)
@@ -87,7 +91,7 @@ class SearchInput(TextArea):
             tab_behavior="focus",  # Tab moves focus, not indent
             **kwargs,
         )
-        self._history: list[str] = []
+        self._history: deque[str] = deque(maxlen=self.HISTORY_LIMIT)
         self._history_index: int = -1
         self._placeholder = "Search code..."
         # Track ESC key timing for ESC+Enter newline detection
@@ -113,10 +117,11 @@ class SearchInput(TextArea):
         row, col = self.cursor_location
         if col == 0:
             return ""
-        lines = self.text.split("\n")
-        if row < len(lines) and col <= len(lines[row]):
-            return lines[row][col - 1]
-        return ""
+        # Fetch only the cursor's line rather than splitting the whole buffer
+        if row >= self.document.line_count:
+            return ""
+        line = self.document.get_line(row)
+        return line[col - 1] if col <= len(line) else ""
 
     def on_key(self, event: Key) -> None:
         """Handle key events for submit and history navigation."""
@@ -148,21 +153,11 @@ class SearchInput(TextArea):
             # Backslash-escape: if character before cursor is \, treat as newline
             # This is the Claude Code approach - works in all terminals
             if self._char_before_cursor() == "\\":
-                # Explicitly rebuild text with backslash removed and newline inserted
-                # (Using action_delete_left + insert doesn't reliably position cursor)
+                # Replace just the backslash with a newline - an incremental edit,
+                # so the document isn't rebuilt from a full split+join
                 row, col = self.cursor_location
-                lines = self.text.split("\n")
-                current_line = lines[row]
-
-                # Split: content before backslash | content after cursor
-                before_backslash = current_line[: col - 1]
-                after_cursor = current_line[col:]
-
-                # Rebuild lines: replace current line with split + insert new line
-                new_lines = lines[:row] + [before_backslash, after_cursor] + lines[row + 1 :]
-
-                # Update text and move cursor to start of new line
-                self.text = "\n".join(new_lines)
+                self.replace("\n", (row, col - 1), (row, col), maintain_selection_offset=False)
+                # Place the cursor explicitly at the start of the new line
                 self.move_cursor((row + 1, 0))
 
                 event.prevent_default()
@@ -195,8 +190,7 @@ class SearchInput(TextArea):
     def _is_cursor_at_last_line(self) -> bool:
         """Check if cursor is on the last line."""
         row, _ = self.cursor_location
-        lines = self.text.split("\n")
-        return row >= len(lines) - 1
+        return row >= self.document.line_count - 1
 
     def _submit(self) -> None:
         """Submit the current text as a command."""
@@ -212,14 +206,13 @@ class SearchInput(TextArea):
         # Parse command
         if text.startswith("/"):
             # Extract command and args from first line or entire text
-            lines = text.split("\n", 1)
-            first_line = lines[0]
+            first_line, _, rest = text.partition("\n")
             parts = first_line.split(maxsplit=1)
             cmd = parts[0].lower()
             args = parts[1] if len(parts) > 1 else ""
             # If multiline, append rest of text to args
-            if len(lines) > 1:
-                args = args + "\n" + lines[1] if args else lines[1]
+            if rest:
+                args = f"{args}\n{rest}" if args else rest
             self.post_message(self.CommandSubmitted(SlashCommand(cmd, args)))
         else:
             # Treat bare text as search
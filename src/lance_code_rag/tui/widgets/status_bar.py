@@ -56,30 +56,37 @@ class StatusBar(Static):
             is_initialized: Whether project is initialized
             indexing_progress: Indexing progress (0.0-1.0) or None
         """
-        if status is not None:
-            self._status = status
-        if status_style is not None:
-            self._status_style = status_style
-        if file_count is not None:
-            self._file_count = file_count
-        if is_initialized is not None:
-            self._is_initialized = is_initialized
-        if indexing_progress is not None:
-            self._indexing_progress = indexing_progress
-        self.refresh()
+        fields = {
+            "status": status,
+            "status_style": status_style,
+            "file_count": file_count,
+            "is_initialized": is_initialized,
+            "indexing_progress": indexing_progress,
+        }
+        self._apply(**{name: value for name, value in fields.items() if value is not None})
+
+    def _apply(self, **fields: object) -> None:
+        """Set render state fields, refreshing only if one actually changed.
+
+        Status updates arrive from every state change (watchers, indexing
+        progress, command handlers), and many repeat the current state.
+        """
+        changed = False
+        for name, value in fields.items():
+            attr = f"_{name}"
+            if getattr(self, attr) != value:
+                setattr(self, attr, value)
+                changed = True
+        if changed:
+            self.refresh()
 
     def set_ready(self) -> None:
         """Set status to ready state."""
-        self._status = "Ready"
-        self._status_style = "green"
-        self._indexing_progress = None
-        self.refresh()
+        self._apply(status="Ready", status_style="green", indexing_progress=None)
 
     def set_searching(self) -> None:
         """Set status to searching state."""
-        self._status = "Searching..."
-        self._status_style = "cyan"
-        self.refresh()
+        self._apply(status="Searching...", status_style="cyan")
 
     def set_indexing(
         self,
@@ -94,19 +101,17 @@ class StatusBar(Static):
             current: Current file number being processed
             total: Total files to process
         """
-        self._status = "Indexing"
-        self._status_style = "yellow"
-        self._indexing_progress = progress
-        self._indexing_current = current
-        self._indexing_total = total
-        self.refresh()
+        self._apply(
+            status="Indexing",
+            status_style="yellow",
+            indexing_progress=progress,
+            indexing_current=current,
+            indexing_total=total,
+        )
 
     def set_not_initialized(self) -> None:
         """Set status to not initialized state."""
-        self._status = "Not initialized"
-        self._status_style = "yellow"
-        self._is_initialized = False
-        self.refresh()
+        self._apply(status="Not initialized", status_style="yellow", is_initialized=False)
 
     def set_status(self, message: str, style: str = "yellow") -> None:
         """Set a temporary status message.
@@ -115,10 +120,7 @@ class StatusBar(Static):
             message: Status message to display
             style: Rich style for the message (default: yellow)
         """
-        self._status = message
-        self._status_style = style
-        self._indexing_progress = None
-        self.refresh()
+        self._apply(status=message, status_style=style, indexing_progress=None)
 
     def render(self) -> RenderableType:
         # Left side: Status indicator
@@ -47,14 +47,14 @@ class WelcomeBox(Static):
         self._is_initialized = is_initialized
         # Pick a random tagline once at startup
         self._tagline = get_random_tagline()
-
-    def render(self) -> RenderableType:
-        # Gradient banner with random tagline
+        # The banner art and tagline never change, so build the gradient once
+        # rather than on every render (resizes, info updates)
         # center=True centers shorter lines (title, tagline) within banner width
-        banner_text = create_gradient_banner(
+        self._banner = create_gradient_banner(
             BANNER_ASCII, show_info=False, center=True, tagline=self._tagline
         )
 
+    def render(self) -> RenderableType:
         # Info line: version + provider + model + file count
         info_parts = [f"v{__version__}"]
 
@@ -91,7 +91,7 @@ class WelcomeBox(Static):
 
         # Combine with centering
         content = Group(
-            Align.center(banner_text),
+            Align.center(self._banner),
             Align.center(info_text),
             Align.center(path_text),
             Text(),  # Empty line for spacing
@@ -111,7 +111,8 @@ class WelcomeBox(Static):
         file_count: int | None = None,
         is_initialized: bool | None = None,
     ) -> None:
-        """Update the displayed info and refresh."""
+        """Update the displayed info, refreshing only if something changed."""
+        current = (self._provider, self._model, self._file_count, self._is_initialized)
         if provider is not None:
             self._provider = provider
         if model is not None:
@@ -120,4 +121,5 @@ class WelcomeBox(Static):
             self._file_count = file_count
         if is_initialized is not None:
             self._is_initialized = is_initialized
-        self.refresh()
+        if current != (self._provider, self._model, self._file_count, self._is_initialized):
+            self.refresh()
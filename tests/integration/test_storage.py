@@ -0,0 +1,191 @@
+"""Integration tests for the LanceDB storage layer.
+
+Uses synthetic vectors so no embedding model download is needed.
+"""
+
+import random
+from dataclasses import asdict
+from pathlib import Path
+
+import pyarrow as pa
+
+from lance_code_rag.search import SearchEngine
+from lance_code_rag.storage import CachedEmbedding, CodeChunk, Storage
+
+DIMENSIONS = 16
+
+
+def make_chunks(count: int, seed: int = 0) -> list[CodeChunk]:
+    """Build chunks with deterministic random vectors."""
+    rng = random.Random(seed)
+    return [
+        CodeChunk(
+            id=f"src/mod_{i}.py:1",
+            vector=[rng.uniform(-1.0, 1.0) for _ in range(DIMENSIONS)],
+            text=f"def func_{i}():\n    return {i}\n",
+            content_hash=f"hash{i}",
+            filepath=f"src/mod_{i}.py",
+            filename=f"mod_{i}.py",
+            extension=".py",
+            type="function",
+            name=f"func_{i}",
+            start_line=1,
+            end_line=2,
+            file_hash=f"file{i}",
+        )
+        for i in range(count)
+    ]
+
+
+class FakeEmbedder:
+    """Embeds every query as a fixed vector."""
+
+    def __init__(self, vector: list[float]):
+        self.vector = vector
+
+    def embed_single(self, text: str) -> list[float]:
+        return self.vector
+
+
+def make_engine(project_root: Path, storage: Storage, query_vector: list[float]) -> SearchEngine:
+    """SearchEngine over an existing Storage, without loading a config or model."""
+    engine = SearchEngine(project_root)
+    engine._storage = storage
+    engine._embedder = FakeEmbedder(query_vector)
+    return engine
+
+
+def squared_l2(a: list[float], b: list[float]) -> float:
+    return sum((x - y) ** 2 for x, y in zip(a, b))
+
+
+class TestRoundTrip:
+    """Tests that rows read back exactly as they were written."""
+
+    def test_chunk_round_trip(self, tmp_path: Path):
+        """Every CodeChunk field survives upsert and read-back."""
+        storage = Storage(tmp_path, dimensions=DIMENSIONS)
+        # Exactly representable in float32, so values compare equal
+        vector = [i / 8 - 1.0 for i in range(DIMENSIONS)]
+        chunk = CodeChunk(
+            id="pkg/auth.py:10",
+            vector=vector,
+            text="class Auth:\n    pass\n",
+            content_hash="abc123",
+            filepath="pkg/auth.py",
+            filename="auth.py",
+            extension=".py",
+            type="class",
+            name="Auth",
+            start_line=10,
+            end_line=11,
+            file_hash="def456",
+        )
+        storage.upsert_chunks([chunk])
+
+        rows = storage.get_chunks_by_filepath("pkg/auth.py")
+        assert len(rows) == 1
+        row = rows[0]
+        for field, value in asdict(chunk).items():
+            if field == "vector":
+                assert list(row["vector"]) == value
+            else:
+                assert row[field] == value, field
+
+        schema = storage._get_chunks_table().schema
+        assert schema.field("vector").type == pa.list_(pa.float32(), DIMENSIONS)
+        assert schema.field("start_line").type == pa.int32()
+        assert schema.field("end_line").type == pa.int32()
+
+    def test_cached_embedding_round_trip(self, tmp_path: Path):
+        """Cached embeddings read back with the same vector, replacing duplicates."""
+        storage = Storage(tmp_path, dimensions=DIMENSIONS)
+        old = [0.0] * DIMENSIONS
+        new = [i / 4 for i in range(DIMENSIONS)]
+        storage.cache_embeddings([CachedEmbedding("h1", old, "2024-01-01T00:00:00")])
+        storage.cache_embeddings([
+            CachedEmbedding("h1", new, "2024-01-02T00:00:00"),
+            CachedEmbedding("h2", old, "2024-01-02T00:00:00"),
+        ])
+
+        assert storage.get_cached_embeddings(["h1", "h2", "missing"]) == {"h1": new, "h2": old}
+        assert storage.count_cached_embeddings() == 2
+
+        table = storage._get_cache_table()
+        assert table.schema.field("vector").type == pa.list_(pa.float32(), DIMENSIONS)
+        created = {r["content_hash"]: r["created_at"] for r in table.to_arrow().to_pylist()}
+        assert created == {"h1": "2024-01-02T00:00:00", "h2": "2024-01-02T00:00:00"}
+
+
+class TestVectorIndex:
+    """Tests for the IVF_PQ vector index."""
+
+    def test_index_not_built_below_threshold(self, tmp_path: Path):
+        """Small tables are left for a flat scan."""
+        storage = Storage(tmp_path, dimensions=DIMENSIONS)
+        storage.upsert_chunks(make_chunks(50))
+
+        assert storage.ensure_vector_index(min_rows=100) is False
+        assert not storage._get_chunks_table().list_indices()
+
+    def test_index_built_above_threshold(self, tmp_path: Path):
+        """Once the table passes min_rows, an index on the vector column exists."""
+        storage = Storage(tmp_path, dimensions=DIMENSIONS)
+        chunks = make_chunks(300)
+        storage.upsert_chunks(chunks)
+
+        assert storage.ensure_vector_index(min_rows=100) is True
+        indices = storage._get_chunks_table().list_indices()
+        assert any("vector" in index.columns for index in indices)
+
+        # Indexed search still finds the exact match first
+        engine = make_engine(tmp_path, storage, chunks[42].vector)
+        results = engine.vector_search("query", limit=5)
+        assert results[0].id == chunks[42].id
+        scores = [r.score for r in results]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_flat_search_orders_by_l2_distance(self, tmp_path: Path):
+        """Without an index, results follow exact L2 distance to the query."""
+        storage = Storage(tmp_path, dimensions=DIMENSIONS)
+        chunks = make_chunks(50)
+        storage.upsert_chunks(chunks)
+        query = make_chunks(1, seed=99)[0].vector
+
+        engine = make_engine(tmp_path, storage, query)
+        results = engine.vector_search("query", limit=5)
+
+        expected = sorted(chunks, key=lambda c: squared_l2(c.vector, query))[:5]
+        assert [r.id for r in results] == [c.id for c in expected]
+        # Score is 1 / (1 + squared L2 distance)
+        top_distance = squared_l2(expected[0].vector, query)
+        assert abs(results[0].score - 1.0 / (1.0 + top_distance)) < 1e-4
+
+
+class TestCompaction:
+    """Tests for table compaction."""
+
+    def test_compacts_across_storage_instances(self, tmp_path: Path):
+        """Fragments left by separate runs (fresh Storage each) add up to a compaction."""
+        chunks = make_chunks(12)
+        for chunk in chunks:
+            Storage(tmp_path, dimensions=DIMENSIONS).upsert_chunks([chunk])
+
+        storage = Storage(tmp_path, dimensions=DIMENSIONS)
+        table = storage._get_chunks_table()
+        assert table.stats()["fragment_stats"]["num_fragments"] == 12
+
+        assert storage.compact_if_fragmented(min_fragments=10) is True
+        table = storage._get_chunks_table()
+        assert table.stats()["fragment_stats"]["num_fragments"] == 1
+        assert table.count_rows() == 12
+
+    def test_skips_compaction_below_threshold(self, tmp_path: Path):
+        """A table with few fragments is left alone."""
+        for chunk in make_chunks(5):
+            Storage(tmp_path, dimensions=DIMENSIONS).upsert_chunks([chunk])
+
+        storage = Storage(tmp_path, dimensions=DIMENSIONS)
+        assert storage.compact_if_fragmented(min_fragments=10) is False
+        table = storage._get_chunks_table()
+        assert table.stats()["fragment_stats"]["num_fragments"] == 5
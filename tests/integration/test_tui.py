@@ -3,14 +3,23 @@
 Uses Textual's Pilot API for testing the TUI without launching a real terminal.
 """
 
+import asyncio
+import queue
 import shutil
+import threading
 from pathlib import Path
 
 import pytest
 from textual.containers import VerticalScroll
 
-from lance_code_rag.tui.app import LCRApp
-from lance_code_rag.tui.widgets import SearchInput, StatusBar
+from lance_code_rag.indexer import IndexStats
+from lance_code_rag.tui.app import (
+    LCRApp,
+    _has_flag,
+    _index_in_subprocess,
+    _parse_search_args,
+)
+from lance_code_rag.tui.widgets import SearchInput, StatusBar, WelcomeBox
 from tests.conftest import setup_lcr_project
 
 
@@ -157,6 +166,38 @@ class TestStatusBar:
             status = app.query_one("#status", StatusBar)
             assert status is not None
 
+    @pytest.mark.asyncio
+    async def test_status_bar_skips_unchanged_refresh(self, tmp_path: Path, monkeypatch):
+        """Setting the state the bar already shows doesn't trigger a refresh."""
+        app = LCRApp(project_root=tmp_path)
+        async with app.run_test():
+            status = app.query_one("#status", StatusBar)
+            status.set_ready()
+
+            refreshes = []
+            monkeypatch.setattr(status, "refresh", lambda *a, **kw: refreshes.append(1))
+            status.set_ready()
+            status.update(is_initialized=status._is_initialized)
+            assert refreshes == []
+
+            status.set_searching()
+            assert refreshes == [1]
+
+    @pytest.mark.asyncio
+    async def test_indexing_restart_resets_progress(self, tmp_path: Path):
+        """A new run resets the bar even if is_indexing never went False."""
+        app = LCRApp(project_root=tmp_path)
+        async with app.run_test():
+            status = app.query_one("#status", StatusBar)
+            app._on_indexing_started("incremental index")
+            app._on_indexing_progress(5, 10, "embedding")
+            assert status._indexing_progress == 0.5
+
+            # e.g. the previous exclusive worker was cancelled mid-run
+            app._on_indexing_started("incremental index")
+            assert status._indexing_progress == 0.0
+            assert status._indexing_total == 0
+
 
 class TestKeyboardShortcuts:
     """Tests for keyboard shortcuts."""
@@ -253,6 +294,21 @@ class TestSearchInput:
             # (exact behavior depends on implementation)
             assert app.is_running
 
+    @pytest.mark.asyncio
+    async def test_backslash_enter_inserts_newline(self, tmp_path: Path):
+        """Backslash + Enter replaces the backslash with a newline."""
+        app = LCRApp(project_root=tmp_path)
+        async with app.run_test() as pilot:
+            input_widget = app.query_one("#input", SearchInput)
+            input_widget.focus()
+            input_widget.text = "first\\second"
+            input_widget.move_cursor((0, 6))
+            await pilot.press("enter")
+            await pilot.pause()
+
+            assert input_widget.text == "first\nsecond"
+            assert input_widget.cursor_location == (1, 0)
+
 
 class TestChatArea:
     """Tests for the chat area (VerticalScroll)."""
@@ -270,6 +326,22 @@ class TestChatArea:
             # Chat area should exist and be scrollable
             assert chat is not None
 
+    @pytest.mark.asyncio
+    async def test_message_burst_scrolls_to_end(self, tmp_path: Path):
+        """A burst of messages queues a single scroll that lands at the end."""
+        app = LCRApp(project_root=tmp_path)
+        async with app.run_test() as pilot:
+            chat = app.query_one("#chat", VerticalScroll)
+            for i in range(30):
+                app._show_status(f"message {i}")
+            assert app._scroll_pending
+
+            await pilot.pause()
+            await pilot.wait_for_scheduled_animations()
+            assert not app._scroll_pending
+            assert chat.max_scroll_y > 0
+            assert chat.scroll_y == chat.max_scroll_y
+
     @pytest.mark.asyncio
     async def test_clear_command_resets_chat(self, tmp_path: Path, sample_project: Path):
         """Clear command removes all content and shows welcome again."""
@@ -293,6 +365,21 @@ class TestChatArea:
             # Should not crash
             assert app.is_running
 
+    @pytest.mark.asyncio
+    async def test_welcome_update_skips_unchanged_refresh(self, tmp_path: Path, monkeypatch):
+        """Updating the welcome box with the info it already shows doesn't refresh it."""
+        app = LCRApp(project_root=tmp_path)
+        async with app.run_test():
+            welcome = app.query_one("#welcome", WelcomeBox)
+            refreshes = []
+            monkeypatch.setattr(welcome, "refresh", lambda *a, **kw: refreshes.append(1))
+
+            welcome.update_info(is_initialized=False)
+            assert refreshes == []
+
+            welcome.update_info(file_count=3)
+            assert refreshes == [1]
+
 
 class TestInlineInit:
     """Tests for inline init wizard flow."""
@@ -375,6 +462,16 @@ class TestInlineSelectorWidget:
             await pilot.pause()
             assert selector._selected_index == 1
 
+            # Only the selected row carries the highlight
+            selected = [w.has_class("selected") for w in selector._option_widgets]
+            assert selected == [False, True, False]
+
+            # Wrap around from the first row to the last
+            await pilot.press("up", "up")
+            await pilot.pause()
+            selected = [w.has_class("selected") for w in selector._option_widgets]
+            assert selected == [False, False, True]
+
     @pytest.mark.asyncio
     async def test_inline_selector_enter_selects(self, tmp_path: Path):
         """Pressing Enter on InlineSelector posts OptionSelected message."""
@@ -405,6 +502,36 @@ class TestInlineSelectorWidget:
 
             assert selected_value == "local"
 
+    @pytest.mark.asyncio
+    async def test_inline_selector_number_quick_selects(self, tmp_path: Path):
+        """Number keys select and submit the matching option; out-of-range keys are ignored."""
+        from textual.app import App, ComposeResult
+
+        from lance_code_rag.tui.widgets import InlineSelector
+
+        selected_values = []
+
+        class TestApp(App):
+            def compose(self) -> ComposeResult:
+                yield InlineSelector(
+                    "Select provider:",
+                    [("local", "Local"), ("openai", "OpenAI")],
+                )
+
+            def on_inline_selector_option_selected(
+                self, event: InlineSelector.OptionSelected
+            ) -> None:
+                selected_values.append(event.value)
+
+        app = TestApp()
+        async with app.run_test() as pilot:
+            await pilot.press("3", "2")
+            await pilot.pause()
+
+            assert selected_values == ["openai"]
+            selector = app.query_one(InlineSelector)
+            assert [w.has_class("selected") for w in selector._option_widgets] == [False, True]
+
     @pytest.mark.asyncio
     async def test_inline_selector_escape_cancels(self, tmp_path: Path):
         """Pressing Escape on InlineSelector posts SelectionCancelled message."""
@@ -454,6 +581,86 @@ class TestInlineSelectorWidget:
             selector = app.query_one(InlineSelector)
             assert selector._selected_index == 1
 
+    @pytest.mark.asyncio
+    async def test_inline_selector_reconfigure(self, tmp_path: Path):
+        """InlineSelector.reconfigure swaps prompt and options in place."""
+        from textual.app import App, ComposeResult
+
+        from lance_code_rag.tui.widgets import InlineSelector
+
+        class TestApp(App):
+            def compose(self) -> ComposeResult:
+                yield InlineSelector("Pick:", [("a", "A"), ("b", "B"), ("c", "C")])
+
+        app = TestApp()
+        async with app.run_test() as pilot:
+            selector = app.query_one(InlineSelector)
+            await selector.reconfigure("Confirm?", [("yes", "Yes"), ("no", "No")], 1)
+            await pilot.pause()
+
+            assert app.query_one(InlineSelector) is selector
+            assert len(selector.query(".option")) == 2
+            assert selector._selected_index == 1
+            rows = [str(w.render()) for w in selector._option_widgets]
+            assert rows == ["  Yes", "› No"]
+
+            await pilot.press("enter")
+            await pilot.pause()
+            assert selector._options[selector._selected_index][0] == "no"
+
+
+class TestSearchResultsDisplay:
+    """Tests for the search results display."""
+
+    @pytest.mark.asyncio
+    async def test_code_previews_highlighted_in_background(self, tmp_path: Path):
+        """Previews are highlighted in the background and lexed once per snippet."""
+        from textual.app import App, ComposeResult
+
+        from lance_code_rag.search import SearchResult, SearchResults
+        from lance_code_rag.tui.widgets.messages import CodePreview, SearchResultsDisplay
+
+        results = SearchResults(
+            results=[
+                SearchResult(
+                    id=f"mod.py:{i}",
+                    text="def add(x, y):\n    return x + y\n",
+                    filepath="mod.py",
+                    filename="mod.py",
+                    name="add",
+                    type="function",
+                    start_line=i,
+                    end_line=i + 1,
+                    score=0.5,
+                )
+                for i in range(3)
+            ],
+            query="add",
+            search_type="hybrid",
+            elapsed_ms=1.0,
+        )
+
+        class TestApp(App):
+            def compose(self) -> ComposeResult:
+                yield SearchResultsDisplay(results)
+
+        app = TestApp()
+        async with app.run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            previews = list(app.query(CodePreview))
+            assert len(previews) == 3
+            assert all(p._highlighted for p in previews)
+            # Identical snippets share one Syntax, so they are lexed once
+            assert len({id(p._syntax) for p in previews}) == 1
+
+            # Re-rendering at a new width reuses the cached highlight
+            cached = [p._syntax._highlight_cache for p in previews]
+            await pilot.resize_terminal(60, 30)
+            await pilot.pause()
+            assert [p._syntax._highlight_cache for p in previews] == cached
+
 
 class TestRemoveCommand:
     """Tests for /remove command."""
@@ -471,3 +678,316 @@ class TestRemoveCommand:
             # Should show error, not crash
             assert app.is_running
             assert app.is_initialized is False
+
+    @pytest.mark.asyncio
+    async def test_remove_keeps_repainting_during_disk_work(
+        self, tmp_path: Path, sample_project: Path, monkeypatch
+    ):
+        """Removal deletes the index in a worker thread, outside any batch_update."""
+        project = tmp_path / "project"
+        shutil.copytree(sample_project, project)
+        setup_lcr_project(project)
+
+        app = LCRApp(project_root=project)
+        async with app.run_test() as pilot:
+            calls = []
+            rmtree = shutil.rmtree
+
+            def recording_rmtree(path):
+                on_main_thread = threading.current_thread() is threading.main_thread()
+                calls.append((app._batch_count, on_main_thread))
+                rmtree(path)
+
+            monkeypatch.setattr("lance_code_rag.tui.app.shutil.rmtree", recording_rmtree)
+            await app._handle_remove_selection("yes")
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+
+            assert calls == [(0, False)]
+            assert not (project / ".lance-code-rag").exists()
+            assert app.is_initialized is False
+            assert app.query_one("#welcome", WelcomeBox) is not None
+
+
+class TestIndexingSubprocess:
+    """Tests for the indexing child process protocol."""
+
+    def test_progress_is_coalesced_then_done(self, tmp_path: Path, monkeypatch):
+        """Per-file progress is thinned to ~1% steps, followed by one done event."""
+        stats = IndexStats(files_scanned=3, total_chunks=7)
+
+        def fake_run_index(project_root, force, verbose, console, progress_callback):
+            assert (project_root, force) == (tmp_path, True)
+            progress_callback(0, 2, "scanning")
+            progress_callback(1, 2, "scanning")
+            for i in range(1000):
+                progress_callback(i, 1000, "embedding")
+            return stats
+
+        monkeypatch.setattr("lance_code_rag.tui.app.run_index", fake_run_index)
+        events = queue.Queue()
+        _index_in_subprocess(tmp_path, True, events)
+        sent = list(events.queue)
+
+        progress = [e for e in sent if e[0] == "progress"]
+        assert progress[:2] == [("progress", 0, 2, "scanning"), ("progress", 1, 2, "scanning")]
+        # Stage change is always forwarded, then at most one event per 1%
+        assert progress[2] == ("progress", 0, 1000, "embedding")
+        assert len(progress) <= 2 + 101
+        assert sent[-1] == ("done", stats)
+        assert [e[0] for e in sent].count("done") == 1
+
+    def test_error_is_relayed(self, tmp_path: Path, monkeypatch):
+        """An exception in the indexer becomes a single error event."""
+
+        def failing_run_index(*args, **kwargs):
+            raise RuntimeError("embedding model unavailable")
+
+        monkeypatch.setattr("lance_code_rag.tui.app.run_index", failing_run_index)
+        events = queue.Queue()
+        _index_in_subprocess(tmp_path, False, events)
+
+        assert list(events.queue) == [("error", "embedding model unavailable")]
+
+    @pytest.mark.asyncio
+    async def test_cancel_terminates_child(self, tmp_path: Path, monkeypatch):
+        """Cancelling the indexing worker terminates the busy child process."""
+
+        class FakeProcess:
+            exitcode = None
+
+            def __init__(self):
+                self.terminated = False
+
+            def is_alive(self):
+                return not self.terminated
+
+            def terminate(self):
+                self.terminated = True
+
+            def join(self, timeout=None):
+                pass
+
+        app = LCRApp(project_root=tmp_path)
+        async with app.run_test() as pilot:
+            process = FakeProcess()
+            requests = queue.Queue()
+
+            def fake_queues():
+                app._index_process = process
+                return requests, queue.Queue()  # Child never reports back
+
+            monkeypatch.setattr(app, "_index_process_queues", fake_queues)
+            app._run_indexing(force=False)
+            await asyncio.sleep(0.2)
+            assert requests.get_nowait() == (tmp_path, False)
+
+            app.workers.cancel_group(app, "indexing")
+            await asyncio.sleep(0.3)
+            await pilot.pause()
+
+            assert process.terminated
+            assert app._index_process is None
+
+
+class TestStatusCache:
+    """Tests for the in-memory config/manifest cache."""
+
+    @pytest.mark.asyncio
+    async def test_load_status_skips_unchanged_files(
+        self, tmp_path: Path, sample_project: Path, monkeypatch
+    ):
+        """Config and manifest are not re-parsed when their mtimes are unchanged."""
+        from lance_code_rag.tui import app as app_module
+
+        project = tmp_path / "project"
+        shutil.copytree(sample_project, project)
+        setup_lcr_project(project)
+
+        app = LCRApp(project_root=project)
+        async with app.run_test():
+            calls = []
+            monkeypatch.setattr(
+                app_module, "load_manifest", lambda root: calls.append(root)
+            )
+            app._load_status()
+            assert calls == []
+
+            # Invalidating forces a reload
+            app._invalidate_status_cache()
+            app._load_status()
+            assert calls == [project]
+
+    @pytest.mark.asyncio
+    async def test_status_panel_reused_when_unchanged(
+        self, tmp_path: Path, sample_project: Path
+    ):
+        """Repeated /status with the same values reuses the rendered panel."""
+        project = tmp_path / "project"
+        shutil.copytree(sample_project, project)
+        setup_lcr_project(project)
+
+        app = LCRApp(project_root=project)
+        async with app.run_test():
+            await app._handle_status("")
+            first = app._status_panel
+            await app._handle_status("")
+            assert app._status_panel is first
+
+    @pytest.mark.asyncio
+    async def test_index_stats_match_saved_manifest(
+        self, tmp_path: Path, sample_project: Path, monkeypatch
+    ):
+        """Stats applied from a run match what the indexer wrote to the manifest."""
+        from lance_code_rag.indexer import run_index
+        from lance_code_rag.manifest import get_manifest_path, load_manifest
+
+        class FakeEmbedder:
+            dimensions = 384
+
+            def embed(self, texts):
+                return [[float(len(text) % 7)] * self.dimensions for text in texts]
+
+        monkeypatch.setattr(
+            "lance_code_rag.indexer.get_embedding_provider", lambda config: FakeEmbedder()
+        )
+        project = tmp_path / "project"
+        shutil.copytree(sample_project, project)
+        setup_lcr_project(project)
+
+        app = LCRApp(project_root=project)
+        async with app.run_test() as pilot:
+            status = app.query_one("#status", StatusBar)
+            # Full run, then an incremental run that drops a file's chunks
+            for change in (None, project / "python_app" / "auth.py"):
+                if change is not None:
+                    change.unlink()
+                app._on_indexing_complete(run_index(project, force=False, verbose=False))
+                await pilot.pause()
+
+                saved = load_manifest(project)
+                assert saved.stats.total_chunks > 0
+                assert app._manifest.stats == saved.stats
+                assert status._file_count == saved.stats.total_files
+                # The cached manifest counts as fresh - no reload on next /status
+                assert app._manifest_mtime == get_manifest_path(project).stat().st_mtime_ns
+
+
+class TestSearchArgs:
+    """Tests for /search flag parsing."""
+
+    def test_plain_query(self):
+        """A query without flags uses the defaults."""
+        assert _parse_search_args("find user auth") == ("find user auth", False, 0.5)
+
+    def test_flags_are_extracted(self):
+        """--fuzzy and --bm25-weight are removed from the query."""
+        assert _parse_search_args("--fuzzy authenticate --bm25-weight 0.8 user") == (
+            "authenticate user",
+            True,
+            0.8,
+        )
+        assert _parse_search_args("user --bm25-weight=0.2") == ("user", False, 0.2)
+
+    def test_flag_substrings_are_not_stripped(self):
+        """Words that merely contain a flag name are kept intact."""
+        assert _parse_search_args("--fuzzyness")[0] == "--fuzzyness"
+
+    def test_unbalanced_quotes(self):
+        """Queries with unbalanced quotes still parse."""
+        assert _parse_search_args("don't panic") == ("don't panic", False, 0.5)
+
+    def test_quotes_are_kept(self):
+        """Quotes in code queries reach the search engine untouched."""
+        assert _parse_search_args('print("hello world") --fuzzy') == (
+            'print("hello world")',
+            True,
+            0.5,
+        )
+
+    def test_backslashes_are_kept(self):
+        """Backslashes are not treated as escapes."""
+        assert _parse_search_args("foo\\bar")[0] == "foo\\bar"
+        assert _parse_search_args("re.compile(r'\\d+') --bm25-weight 0.3") == (
+            "re.compile(r'\\d+')",
+            False,
+            0.3,
+        )
+
+    def test_newlines_are_kept(self):
+        """Multiline queries keep their line structure."""
+        query = "def foo():\n    return 1"
+        assert _parse_search_args(f"--fuzzy {query}") == (query, True, 0.5)
+        assert _parse_search_args(f"{query}\n--bm25-weight=0.9") == (query, False, 0.9)
+
+    def test_non_numeric_weight_is_kept_as_text(self):
+        """A --bm25-weight without a number leaves its value in the query."""
+        assert _parse_search_args("--bm25-weight high user") == ("high user", False, 0.5)
+
+
+class TestHasFlag:
+    """Tests for whole-token flag detection in command args."""
+
+    def test_exact_flag(self):
+        """A flag is found wherever it appears as its own token."""
+        assert _has_flag("--force", "--force")
+        assert _has_flag("src --force", "--force")
+        assert not _has_flag("", "--force")
+
+    def test_flag_prefix_does_not_match(self):
+        """Longer tokens that merely start with the flag don't count."""
+        assert not _has_flag("--forceful", "--force")
+        assert not _has_flag("--force=1", "--force")
+
+
+class TestGitignoreEntry:
+    """Tests for adding/removing the .gitignore entry."""
+
+    def test_remove_restores_original_content(self, tmp_path: Path):
+        """Removing the entry leaves the rest of .gitignore untouched."""
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("node_modules/\n*.log\n")
+
+        app = LCRApp(project_root=tmp_path)
+        app._update_gitignore()
+        assert ".lance-code-rag/" in gitignore.read_text()
+
+        app._remove_gitignore_entry()
+        assert gitignore.read_text() == "node_modules/\n*.log\n"
+
+    def test_update_creates_file_once(self, tmp_path: Path):
+        """A missing .gitignore is created, and repeat updates don't duplicate the entry."""
+        gitignore = tmp_path / ".gitignore"
+        app = LCRApp(project_root=tmp_path)
+
+        app._update_gitignore()
+        app._update_gitignore()
+        assert gitignore.read_text() == "# Lance Code RAG\n.lance-code-rag/\n"
+
+    def test_update_leaves_read_only_file_with_entry(self, tmp_path: Path):
+        """An entry already in a read-only .gitignore needs no write access."""
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("node_modules/\n.lance-code-rag/\n")
+        gitignore.chmod(0o444)
+        app = LCRApp(project_root=tmp_path)
+
+        app._update_gitignore()
+        assert gitignore.read_text() == "node_modules/\n.lance-code-rag/\n"
+
+
+class TestMcpConfig:
+    """Tests for adding the .mcp.json server entry."""
+
+    def test_update_skips_write_when_unchanged(self, tmp_path: Path):
+        """Re-running the update doesn't rewrite an already-configured file."""
+        mcp_path = tmp_path / ".mcp.json"
+        app = LCRApp(project_root=tmp_path)
+
+        app._update_mcp_config()
+        assert "lance-code-rag" in mcp_path.read_text()
+
+        # Reformat by hand; an unchanged entry must not be re-serialized
+        mcp_path.write_text(mcp_path.read_text().replace("  ", "    "))
+        before = mcp_path.read_text()
+        app._update_mcp_config()
+        assert mcp_path.read_text() == before